@@ -4,13 +4,50 @@ Case Management System for Family Law Practice
 Tracks cases, deadlines, documents, and tasks
 """
 
+import atexit
+import heapq
+import itertools
 import json
 import os
-from datetime import datetime, timedelta
+import sqlite3
+import sys
+import threading
+import time
+import weakref
+import numpy as np
+import pandas as pd
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from datetime import date, datetime
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict, MISSING
 from enum import Enum
 
+# Optional fast JSON backend
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(data: Dict, indent: bool = True) -> bytes:
+    """Serialize case data to UTF-8 JSON, indented unless indent is False"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+
+def _json_loads(raw: bytes) -> Dict:
+    """Parse case data from JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class CaseStatus(Enum):
     INTAKE = "Intake"
@@ -62,7 +99,29 @@ class TaskStatus(Enum):
     CANCELLED = "Cancelled"
 
 
-@dataclass
+# Slotted records (no per-instance __dict__) where the interpreter supports it
+RECORD_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _record_to_dict(record) -> Dict:
+    """Convert a record to a plain dict, leaving out private cache fields"""
+    return {k: v for k, v in asdict(record).items() if not k.startswith('_')}
+
+
+# Status groups used by the hot filters, resolved once from the enums
+OPEN_TASK_STATUSES = (TaskStatus.PENDING.value, TaskStatus.IN_PROGRESS.value)
+INACTIVE_CASE_STATUSES = (CaseStatus.CLOSED.value, CaseStatus.ON_HOLD.value)
+
+# Sort rank per task priority (enum declaration order, most urgent first)
+PRIORITY_ORDER = {p.value: rank for rank, p in enumerate(TaskPriority)}
+DEFAULT_PRIORITY_RANK = PRIORITY_ORDER[TaskPriority.MEDIUM.value]
+
+# Urgency levels and the day counts at which each one starts (after OVERDUE)
+URGENCY_LEVELS = ("OVERDUE", "CRITICAL", "URGENT", "APPROACHING", "SCHEDULED")
+URGENCY_BOUNDS = (0, 2, 4, 8)
+
+
+@dataclass(**RECORD_OPTIONS)
 class Deadline:
     """A deadline or court date"""
     id: str
@@ -77,34 +136,51 @@ class Deadline:
     completed: bool = False
     created_date: str = field(default_factory=lambda: datetime.now().isoformat())
 
+    # Proleptic ordinal of due_date (0 until parsed), never serialized
+    _due_ord: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        if name == 'due_date':
+            object.__setattr__(self, '_due_ord', 0)
+        object.__setattr__(self, name, value)
+
+    @property
+    def due_ordinal(self) -> int:
+        """Due date as an integer day ordinal, cached until due_date changes"""
+        if not self._due_ord:
+            self._due_ord = date.fromisoformat(self.due_date).toordinal()
+        return self._due_ord
+
+    @property
+    def due(self) -> date:
+        """Parsed due date"""
+        return date.fromordinal(self.due_ordinal)
+
+    def days_until(self, today: Optional[date] = None) -> int:
+        """Calculate days from today (or the given date) until the deadline"""
+        return self.due_ordinal - (today or date.today()).toordinal()
+
     @property
     def days_until_due(self) -> int:
         """Calculate days until deadline"""
-        due = datetime.strptime(self.due_date, "%Y-%m-%d")
-        return (due - datetime.now()).days
+        return self.days_until()
+
+    def is_overdue_on(self, today: Optional[date] = None) -> bool:
+        """Check if deadline is past as of today (or the given date)"""
+        return not self.completed and self.days_until(today) < 0
 
     @property
     def is_overdue(self) -> bool:
         """Check if deadline is past"""
-        return self.days_until_due < 0 and not self.completed
+        return self.is_overdue_on()
 
     @property
     def urgency_level(self) -> str:
         """Get urgency level based on days remaining"""
-        days = self.days_until_due
-        if days < 0:
-            return "OVERDUE"
-        elif days <= 1:
-            return "CRITICAL"
-        elif days <= 3:
-            return "URGENT"
-        elif days <= 7:
-            return "APPROACHING"
-        else:
-            return "SCHEDULED"
+        return URGENCY_LEVELS[bisect_right(URGENCY_BOUNDS, self.days_until_due)]
 
 
-@dataclass
+@dataclass(**RECORD_OPTIONS)
 class Task:
     """A task to be completed"""
     id: str
@@ -122,7 +198,7 @@ class Task:
     tags: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**RECORD_OPTIONS)
 class CaseNote:
     """A note or update on a case"""
     id: str
@@ -134,7 +210,7 @@ class CaseNote:
     is_privileged: bool = False
 
 
-@dataclass
+@dataclass(**RECORD_OPTIONS)
 class Case:
     """A family law case"""
     id: str
@@ -172,60 +248,598 @@ class Case:
     children: List[Dict] = field(default_factory=list)
 
 
+class RecordDecoder:
+    """Build records of one dataclass type from decoded JSON dicts"""
+
+    def __init__(self, record_type):
+        self.record_type = record_type
+        self.field_names = frozenset(f.name for f in fields(record_type) if f.init)
+        self.defaults = {f.name: f.default for f in fields(record_type) if f.default is not MISSING}
+
+    def decode_one(self, data: Dict):
+        """Decode one record, ignoring keys the record does not declare"""
+        names = self.field_names
+        return self.record_type(**{k: v for k, v in data.items() if k in names})
+
+    def decode(self, raw: Dict[str, Dict]) -> Dict:
+        """Decode an ID -> dict mapping"""
+        return {record_id: self.decode_one(data) for record_id, data in raw.items()}
+
+
+class RawRecordView:
+    """Read-only attribute access to a stored dict, falling back to field defaults"""
+
+    __slots__ = ('_data', '_defaults')
+
+    def __init__(self, data: Dict, defaults: Dict):
+        self._data = data
+        self._defaults = defaults
+
+    def __getattr__(self, name):
+        try:
+            return self._data[name]
+        except KeyError:
+            try:
+                return self._defaults[name]
+            except KeyError:
+                raise AttributeError(name) from None
+
+
+class LazyRecords(MutableMapping):
+    """ID -> record mapping that keeps loaded records as plain dicts and only
+    builds the dataclass the first time a record is accessed"""
+
+    def __init__(self, decoder: RecordDecoder):
+        self._decoder = decoder
+        self._items: Dict = {}
+        self._raw_ids: set = set()
+
+    def load(self, raw: Dict[str, Dict]):
+        """Add stored records without decoding them"""
+        self._items.update(raw)
+        self._raw_ids.update(raw)
+
+    def __getitem__(self, record_id):
+        item = self._items[record_id]
+        if record_id in self._raw_ids:
+            item = self._decoder.decode_one(item)
+            self._items[record_id] = item
+            self._raw_ids.discard(record_id)
+        return item
+
+    def __setitem__(self, record_id, record):
+        self._items[record_id] = record
+        self._raw_ids.discard(record_id)
+
+    def __delitem__(self, record_id):
+        del self._items[record_id]
+        self._raw_ids.discard(record_id)
+
+    def __contains__(self, record_id):
+        return record_id in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def raw(self, record_id) -> Optional[Dict]:
+        """The stored dict for a record that has not been decoded yet, else None"""
+        return self._items[record_id] if record_id in self._raw_ids else None
+
+    def peek(self, record_id):
+        """Read a record's fields without decoding it"""
+        raw = self.raw(record_id)
+        if raw is None:
+            return self[record_id]
+        return RawRecordView(raw, self._decoder.defaults)
+
+
+# Store section name -> decoder for its records
+RECORD_DECODERS = {
+    'cases': RecordDecoder(Case),
+    'deadlines': RecordDecoder(Deadline),
+    'tasks': RecordDecoder(Task),
+    'notes': RecordDecoder(CaseNote),
+}
+
+
+class JSONCaseStore:
+    """Stores all records in one JSON file that is rewritten on every save"""
+
+    # Saves need every record's view, not just the changed ones
+    full_snapshot = True
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def load(self) -> Dict[str, Dict[str, Dict]]:
+        with open(self.path, 'rb') as f:
+            return _json_loads(f.read())
+
+    def capture(self, views: Dict[str, Dict[str, Dict]], changed: Dict[str, List[str]]) -> Dict:
+        """Build the write payload on the caller's thread"""
+        data = {section: dict(section_views) for section, section_views in views.items()}
+        data['last_updated'] = datetime.now().isoformat()
+        return data
+
+    def merge(self, pending: Dict, payload: Dict) -> Dict:
+        """Combine an unwritten payload with a newer one"""
+        return payload
+
+    def close(self):
+        pass
+
+    def write(self, payload: Dict):
+        """Replace the file atomically"""
+        tmp_file = f"{self.path}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(_json_dumps(payload))
+        os.replace(tmp_file, self.path)
+
+
+# Indexed columns per table; every table also has id and the full record as JSON
+SQLITE_COLUMNS = {
+    'cases': ('status', 'case_type', 'open_date', 'client_name'),
+    'deadlines': ('case_id', 'due_date', 'completed'),
+    'tasks': ('case_id', 'status', 'priority'),
+    'notes': ('case_id',),
+}
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cases (
+    id TEXT PRIMARY KEY, status TEXT, case_type TEXT, open_date TEXT, client_name TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS deadlines (
+    id TEXT PRIMARY KEY, case_id TEXT, due_date TEXT, completed INTEGER, data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY, case_id TEXT, status TEXT, priority TEXT, data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS notes (
+    id TEXT PRIMARY KEY, case_id TEXT, data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cases_status ON cases(status);
+CREATE INDEX IF NOT EXISTS idx_cases_type ON cases(case_type);
+CREATE INDEX IF NOT EXISTS idx_deadlines_case ON deadlines(case_id);
+CREATE INDEX IF NOT EXISTS idx_deadlines_due ON deadlines(due_date) WHERE NOT completed;
+CREATE INDEX IF NOT EXISTS idx_tasks_case ON tasks(case_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_status_priority ON tasks(status, priority);
+CREATE INDEX IF NOT EXISTS idx_notes_case ON notes(case_id);
+"""
+
+
+class SQLiteCaseStore:
+    """Stores records as rows in a SQLite database (WAL mode); saves touch only changed rows"""
+
+    full_snapshot = False
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None  # used by the writer thread
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SQLITE_SCHEMA)
+        return conn
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def _load_table(self, section: str) -> Dict[str, Dict]:
+        """Read one table as an ID -> record dict using its own connection"""
+        conn = sqlite3.connect(self.path)
+        try:
+            try:
+                # Let SQLite assemble the table into one JSON object, parsed in a single call
+                (document,) = conn.execute(
+                    f"SELECT json_group_object(id, json(data)) FROM {section}").fetchone()
+                return _json_loads(document)
+            except sqlite3.OperationalError:
+                # SQLite built without the JSON functions
+                return {record_id: _json_loads(data)
+                        for record_id, data in conn.execute(f"SELECT id, data FROM {section}")}
+        finally:
+            conn.close()
+
+    def load(self) -> Dict[str, Dict[str, Dict]]:
+        """Read all tables concurrently; SQLite releases the GIL while it works"""
+        self._connect().close()  # create the schema before the readers start
+        with ThreadPoolExecutor(max_workers=len(SQLITE_COLUMNS)) as pool:
+            tables = pool.map(self._load_table, SQLITE_COLUMNS)
+            return dict(zip(SQLITE_COLUMNS, tables))
+
+    def capture(self, views: Dict[str, Dict[str, Dict]], changed: Dict[str, List[str]]) -> Dict:
+        """Collect the changed rows; None marks a deleted record"""
+        return {
+            section: {record_id: views[section].get(record_id) for record_id in record_ids}
+            for section, record_ids in changed.items() if record_ids
+        }
+
+    def merge(self, pending: Dict, payload: Dict) -> Dict:
+        for section, rows in payload.items():
+            pending.setdefault(section, {}).update(rows)
+        return pending
+
+    def write(self, payload: Dict):
+        """Upsert changed rows in a single transaction"""
+        if self._conn is None:
+            self._conn = self._connect()
+
+        with self._conn:
+            for section, rows in payload.items():
+                columns = SQLITE_COLUMNS[section]
+                # Update in place (not REPLACE) so rows keep their rowid and load order
+                upsert = (f"INSERT INTO {section} (id, {', '.join(columns)}, data) "
+                          f"VALUES ({', '.join('?' * (len(columns) + 2))}) "
+                          f"ON CONFLICT(id) DO UPDATE SET "
+                          + ", ".join(f"{c} = excluded.{c}" for c in columns + ('data',)))
+                self._conn.executemany(upsert, [
+                    (record_id, *(view[c] for c in columns), _json_dumps(view, indent=False).decode('utf-8'))
+                    for record_id, view in rows.items() if view is not None
+                ])
+                self._conn.executemany(f"DELETE FROM {section} WHERE id = ?", [
+                    (record_id,) for record_id, view in rows.items() if view is None
+                ])
+
+    def close(self):
+        """Close the writer connection, folding the WAL back into the database file"""
+        if self._conn is not None:
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            finally:
+                self._conn.close()
+                self._conn = None
+
+    def remove(self):
+        """Delete the database file and its WAL and journal files, if present"""
+        for suffix in ('', '-wal', '-shm', '-journal'):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+
+
+def open_case_store(path: str):
+    """Pick the storage backend from the data file's extension"""
+    if os.path.splitext(path)[1].lower() in ('.db', '.sqlite', '.sqlite3'):
+        return SQLiteCaseStore(path)
+    return JSONCaseStore(path)
+
+
+# Case fields exposed by CaseManager.get_cases_frame()
+CASE_FRAME_COLUMNS = (
+    'id', 'case_number', 'client_name', 'opposing_party', 'case_type', 'status',
+    'court', 'county', 'attorney', 'paralegal', 'open_date', 'close_date',
+    'retainer_amount', 'retainer_balance', 'total_billed',
+)
+
+# Managers with writes queued since they were last closed, flushed at exit
+_OPEN_MANAGERS = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_managers():
+    for manager in list(_OPEN_MANAGERS):
+        try:
+            manager.flush()
+        except Exception:
+            pass  # already reported by the writer
+
+
 class CaseManager:
     """Manage all cases, deadlines, and tasks"""
 
-    def __init__(self, data_file: str = "case_data.json"):
+    def __init__(self, data_file: str = "case_data.db"):
         self.data_file = data_file
+        self._store = open_case_store(data_file)
         self.cases: Dict[str, Case] = {}
-        self.deadlines: Dict[str, Deadline] = {}
-        self.tasks: Dict[str, Task] = {}
-        self.notes: Dict[str, CaseNote] = {}
-        self._load_data()
-
-    def _load_data(self):
-        """Load data from JSON file"""
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-
-                for case_id, case_data in data.get('cases', {}).items():
-                    self.cases[case_id] = Case(**case_data)
-
-                for dl_id, dl_data in data.get('deadlines', {}).items():
-                    self.deadlines[dl_id] = Deadline(**dl_data)
+        # Deadlines, tasks and notes are decoded on first access
+        self.deadlines = LazyRecords(RECORD_DECODERS['deadlines'])
+        self.tasks = LazyRecords(RECORD_DECODERS['tasks'])
+        self.notes = LazyRecords(RECORD_DECODERS['notes'])
+        self._dirty = False
+        self._autosave = True
+        # Serialized dict view of each record, refreshed only for changed IDs
+        self._record_views: Dict[str, Dict[str, Dict]] = {section: {} for section in RECORD_DECODERS}
+        # Changed IDs per section, insertion-ordered so new records keep their order on disk
+        self._dirty_ids: Dict[str, Dict[str, None]] = {section: {} for section in RECORD_DECODERS}
+        # Background writer: the latest snapshot waits in _pending_write
+        self._write_cond = threading.Condition()
+        self._pending_write: Optional[Dict] = None
+        self._writer: Optional[threading.Thread] = None  # runs only while writes are queued
+        # First save error since the last flush(), raised from there
+        self._save_error: Optional[Exception] = None
+        # Per-case revision, bumped when the case or one of its records changes
+        self._case_revs: Dict[str, int] = defaultdict(int)
+        self._summary_cache = lru_cache(maxsize=256)(self._compute_case_summary)
+        # Millisecond-seeded so IDs stay unique across sessions
+        self._id_counter = itertools.count(int(time.time() * 1000))
+
+        # Secondary indexes: key -> ordered set (dict with None values) of IDs
+        self._cases_by_status: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._cases_by_type: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._tasks_by_case: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._tasks_by_status: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._tasks_by_priority: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._open_deadlines: Dict[str, None] = {}
+        # Min-heap of (due date ordinal, deadline ID); completed entries are dropped lazily
+        self._deadline_heap: List[Tuple[int, str]] = []
+        # Columnar view of the cases, rebuilt lazily after any case change
+        self._cases_frame: Optional[pd.DataFrame] = None
+
+        migrated = self._load_data()
+        self._rebuild_indexes()
+        if self._store.full_snapshot or migrated:
+            self._mark_all_dirty()
+        if migrated:
+            self._migrate()
+
+    def _load_data(self) -> bool:
+        """Load data from the store. A new SQLite store is seeded from a JSON
+        file with the same name, if one exists; returns True if that worked."""
+        source = self._store
+        if not source.exists():
+            legacy_file = os.path.splitext(self.data_file)[0] + '.json'
+            if isinstance(source, SQLiteCaseStore) and os.path.exists(legacy_file):
+                source = JSONCaseStore(legacy_file)
+            else:
+                return False
 
-                for task_id, task_data in data.get('tasks', {}).items():
-                    self.tasks[task_id] = Task(**task_data)
+        try:
+            data = source.load()
+            self.cases.update(RECORD_DECODERS['cases'].decode(data.get('cases', {})))
+            for section in ('deadlines', 'tasks', 'notes'):
+                getattr(self, section).load(data.get(section, {}))
 
-                for note_id, note_data in data.get('notes', {}).items():
-                    self.notes[note_id] = CaseNote(**note_data)
+        except Exception as e:
+            print(f"Error loading case data: {e}")
+            if source is not self._store:
+                self._set_aside(source.path, e)
+                for section in RECORD_DECODERS:
+                    getattr(self, section).clear()
+            return False
+
+        return source is not self._store
+
+    @staticmethod
+    def _set_aside(legacy_file: str, error: Exception):
+        """Rename a legacy file that could not be migrated, so that the new
+        database starts empty without hiding it; re-raise the load error if
+        the file cannot be moved."""
+        aside = f"{legacy_file}.corrupt"
+        for n in itertools.count(1):
+            if not os.path.exists(aside):
+                break
+            aside = f"{legacy_file}.corrupt{n}"
+        try:
+            os.replace(legacy_file, aside)
+        except OSError:
+            raise error
+        print(f"Moved unreadable {legacy_file} to {aside}; starting with no cases")
+
+    def _migrate(self):
+        """Write the records loaded from the legacy JSON file to the new SQLite
+        store in one synchronous transaction. The database is built under a
+        staging name and only renamed once that transaction has committed, so a
+        failed migration leaves no database behind and is retried on the next
+        start; until then this manager keeps saving to the JSON file."""
+        store = self._store
+        staging = SQLiteCaseStore(f"{store.path}.migrating")
+        staging.remove()  # leftovers of an interrupted attempt
+        try:
+            staging.write(self._capture_changes())
+            staging.close()
+            os.replace(staging.path, store.path)
+            self._dirty = False
 
-            except Exception as e:
-                print(f"Error loading case data: {e}")
+        except Exception as e:
+            print(f"Error migrating case data: {e}")
+            try:
+                staging.close()
+            except sqlite3.Error:
+                pass
+            staging.remove()
+            self._store = JSONCaseStore(os.path.splitext(self.data_file)[0] + '.json')
+            self._mark_all_dirty()
+
+    def _mark_all_dirty(self):
+        """Queue every record for the next save"""
+        for section in RECORD_DECODERS:
+            self._dirty_ids[section].update(dict.fromkeys(getattr(self, section)))
+
+    def _capture_changes(self) -> Dict:
+        """Refresh the save views of changed records and build the store's payload"""
+        changed = {}
+        for section, dirty_ids in self._dirty_ids.items():
+            records = getattr(self, section)
+            views = self._record_views[section]
+            decoder = RECORD_DECODERS[section]
+            for record_id in dirty_ids:
+                if record_id not in records:
+                    views.pop(record_id, None)
+                    continue
+                raw = records.raw(record_id) if isinstance(records, LazyRecords) else None
+                if raw is not None and decoder.field_names.issubset(raw):
+                    views[record_id] = raw
+                elif raw is not None:
+                    # Legacy dict missing defaulted fields: store it with the defaults filled in
+                    views[record_id] = _record_to_dict(decoder.decode_one(raw))
+                else:
+                    views[record_id] = _record_to_dict(records[record_id])
+            changed[section] = list(dirty_ids)
+            dirty_ids.clear()
+
+        return self._store.capture(self._record_views, changed)
 
     def _save_data(self):
-        """Save data to JSON file"""
+        """Capture changed records and queue them for the background writer"""
         try:
-            data = {
-                'cases': {k: asdict(v) for k, v in self.cases.items()},
-                'deadlines': {k: asdict(v) for k, v in self.deadlines.items()},
-                'tasks': {k: asdict(v) for k, v in self.tasks.items()},
-                'notes': {k: asdict(v) for k, v in self.notes.items()},
-                'last_updated': datetime.now().isoformat()
-            }
-
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._queue_write(self._capture_changes())
+            self._dirty = False
 
         except Exception as e:
             print(f"Error saving case data: {e}")
+            self._record_save_error(e)
+
+    def _record_save_error(self, error: Exception):
+        with self._write_cond:
+            if self._save_error is None:
+                self._save_error = error
+
+    def _queue_write(self, payload: Dict):
+        """Hand a payload to the writer thread, merging it with any unwritten one"""
+        with self._write_cond:
+            if self._pending_write is None:
+                self._pending_write = payload
+            else:
+                self._pending_write = self._store.merge(self._pending_write, payload)
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+                self._writer.start()
+        _OPEN_MANAGERS.add(self)
+
+    def _writer_loop(self):
+        """Write queued payloads to the store, exiting once the queue is empty"""
+        while True:
+            with self._write_cond:
+                payload = self._pending_write
+                if payload is None:
+                    self._writer = None
+                    self._write_cond.notify_all()
+                    return
+                self._pending_write = None
+
+            try:
+                self._store.write(payload)
+            except Exception as e:
+                print(f"Error saving case data: {e}")
+                self._record_save_error(e)
+
+    def _rebuild_indexes(self):
+        """Rebuild all secondary indexes from the record dicts"""
+        for index in (self._cases_by_status, self._cases_by_type, self._tasks_by_case,
+                      self._tasks_by_status, self._tasks_by_priority, self._open_deadlines):
+            index.clear()
+
+        for case in self.cases.values():
+            self._index_case(case)
+        for task_id in self.tasks:
+            self._index_task(self.tasks.peek(task_id))
+        self._deadline_heap.clear()
+        for dl_id in self.deadlines:
+            if not self.deadlines.peek(dl_id).completed:
+                self._open_deadlines[dl_id] = None
+                self._push_deadline(self.deadlines[dl_id])
+
+    def _push_deadline(self, deadline: Deadline):
+        """Add an open deadline to the due-date heap (skipped if unparseable)"""
+        try:
+            heapq.heappush(self._deadline_heap, (deadline.due_ordinal, deadline.id))
+        except (TypeError, ValueError):
+            pass
+
+    def _open_deadlines_due_by(self, last_ordinal: int) -> List[Deadline]:
+        """Open deadlines due on or before the given day ordinal, earliest first"""
+        heap = self._deadline_heap
+        found: Dict[str, int] = {}
+        while heap and heap[0][0] <= last_ordinal:
+            due, dl_id = heapq.heappop(heap)
+            deadline = self.deadlines.get(dl_id)
+            # Completed, deleted, or a duplicate of an entry already found
+            if dl_id not in self._open_deadlines or deadline is None or dl_id in found:
+                continue
+            try:
+                current = deadline.due_ordinal
+            except (TypeError, ValueError):
+                continue  # due_date no longer parses
+            if current == due:
+                found[dl_id] = due
+            else:
+                # Rescheduled since the entry was pushed: requeue it under its current date
+                self._push_deadline(deadline)
+
+        for dl_id, due in found.items():
+            heapq.heappush(heap, (due, dl_id))
+        return [self.deadlines[dl_id] for dl_id in found]
+
+    def _index_case(self, case: Case):
+        self._cases_frame = None
+        self._cases_by_status[case.status][case.id] = None
+        self._cases_by_type[case.case_type][case.id] = None
+
+    def _unindex_case(self, case: Case):
+        self._cases_by_status[case.status].pop(case.id, None)
+        self._cases_by_type[case.case_type].pop(case.id, None)
+
+    def _index_task(self, task: Task):
+        self._tasks_by_case[task.case_id][task.id] = None
+        self._tasks_by_status[task.status][task.id] = None
+        self._tasks_by_priority[task.priority][task.id] = None
+
+    def _unindex_task(self, task: Task):
+        self._tasks_by_case[task.case_id].pop(task.id, None)
+        self._tasks_by_status[task.status].pop(task.id, None)
+        self._tasks_by_priority[task.priority].pop(task.id, None)
+
+    def _mark_dirty(self, *changes: Tuple[str, str]):
+        """Record changed (section, record ID) pairs and persist unless a batch is open"""
+        for section, record_id in changes:
+            self._dirty_ids[section][record_id] = None
+            if section == 'cases':
+                self._case_revs[record_id] += 1
+            else:
+                record = getattr(self, section).get(record_id)
+                if record is not None:
+                    self._case_revs[record.case_id] += 1
+        self._dirty = True
+        if self._autosave:
+            self._save_data()
+
+    def flush(self):
+        """Write pending changes to disk and wait for the writer to finish.
+        Raises the first error hit while saving since the previous flush."""
+        if self._dirty:
+            self._save_data()
+        with self._write_cond:
+            while self._writer is not None:
+                self._write_cond.wait()
+            error, self._save_error = self._save_error, None
+        if error is not None:
+            raise error
+
+    def close(self):
+        """Flush pending changes and release the store's connection"""
+        try:
+            self.flush()
+        finally:
+            self._store.close()
+            _OPEN_MANAGERS.discard(self)
+
+    @contextmanager
+    def batch(self):
+        """Group several mutations into a single write"""
+        previous = self._autosave
+        self._autosave = False
+        try:
+            yield self
+        finally:
+            self._autosave = previous
+            if previous and self._dirty:
+                self._save_data()
 
     def _generate_id(self, prefix: str) -> str:
         """Generate a unique ID"""
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        return f"{prefix}_{timestamp}"
+        while True:
+            new_id = f"{prefix}_{next(self._id_counter):x}"
+            if not any(new_id in records for records in
+                       (self.cases, self.deadlines, self.tasks, self.notes)):
+                return new_id
 
     # Case Management
     def create_case(self, case_data: Dict) -> Case:
@@ -253,11 +867,13 @@ class CaseManager:
         )
 
         self.cases[case_id] = case
+        self._index_case(case)
 
-        # Create default tasks for new case
-        self._create_intake_tasks(case_id)
+        # Create default tasks for new case in one write
+        with self.batch():
+            self._create_intake_tasks(case_id)
+            self._mark_dirty(('cases', case_id))
 
-        self._save_data()
         return case
 
     def _create_intake_tasks(self, case_id: str):
@@ -295,47 +911,84 @@ class CaseManager:
             return None
 
         case = self.cases[case_id]
+        self._unindex_case(case)
         for key, value in updates.items():
             if hasattr(case, key):
                 setattr(case, key, value)
+        self._index_case(case)
 
-        self._save_data()
+        self._mark_dirty(('cases', case_id))
         return case
 
     def get_all_cases(self, status_filter: str = None) -> List[Case]:
         """Get all cases, optionally filtered by status"""
-        cases = list(self.cases.values())
-
         if status_filter:
-            cases = [c for c in cases if c.status == status_filter]
+            cases = [self.cases[c] for c in self._cases_by_status.get(status_filter, ())]
+        else:
+            cases = list(self.cases.values())
 
         return sorted(cases, key=lambda c: c.open_date, reverse=True)
 
+    def get_cases_frame(self) -> pd.DataFrame:
+        """Get a columnar (one column per field) view of all cases for analytics.
+        The frame is cached until a case changes; treat it as read-only."""
+        if self._cases_frame is None:
+            cases = list(self.cases.values())
+            self._cases_frame = pd.DataFrame({
+                column: [getattr(c, column) for c in cases]
+                for column in CASE_FRAME_COLUMNS
+            })
+        return self._cases_frame
+
     def get_case_summary(self, case_id: str) -> Dict:
-        """Get a summary of a case with related items"""
+        """Get a summary of a case with related items (cached until the case changes)"""
+        summary = self._summary_cache(case_id, self._case_revs.get(case_id, 0), date.today().toordinal())
+        # Hand out a copy so callers cannot alter the cached entry
+        return {key: list(value) if isinstance(value, list) else value for key, value in summary.items()}
+
+    def _compute_case_summary(self, case_id: str, revision: int, today_ordinal: int) -> Dict:
+        """Build a case summary; revision and today_ordinal only key the cache"""
         case = self.get_case(case_id)
         if not case:
             return {}
 
-        deadlines = [self.deadlines[d] for d in case.deadlines if d in self.deadlines]
-        tasks = [self.tasks[t] for t in case.tasks if t in self.tasks]
-
-        upcoming_deadlines = sorted(
-            [d for d in deadlines if not d.completed],
-            key=lambda d: d.due_date
-        )[:5]
-
-        pending_tasks = [t for t in tasks if t.status in ['Pending', 'In Progress']]
+        today = date.fromordinal(today_ordinal)
+        total_deadlines = completed_deadlines = overdue_items = 0
+        open_deadlines = []
+        for dl_id in case.deadlines:
+            deadline = self.deadlines.get(dl_id)
+            if deadline is None:
+                continue
+            total_deadlines += 1
+            if deadline.completed:
+                completed_deadlines += 1
+            else:
+                open_deadlines.append(deadline)
+                if deadline.is_overdue_on(today):
+                    overdue_items += 1
+
+        total_tasks = completed_tasks = 0
+        pending_tasks = []
+        completed = TaskStatus.COMPLETED.value
+        for task_id in case.tasks:
+            task = self.tasks.get(task_id)
+            if task is None:
+                continue
+            total_tasks += 1
+            if task.status in OPEN_TASK_STATUSES:
+                pending_tasks.append(task)
+            elif task.status == completed:
+                completed_tasks += 1
 
         return {
             'case': case,
-            'upcoming_deadlines': upcoming_deadlines,
+            'upcoming_deadlines': heapq.nsmallest(5, open_deadlines, key=lambda d: d.due_date),
             'pending_tasks': pending_tasks,
-            'total_deadlines': len(deadlines),
-            'completed_deadlines': len([d for d in deadlines if d.completed]),
-            'total_tasks': len(tasks),
-            'completed_tasks': len([t for t in tasks if t.status == 'Completed']),
-            'overdue_items': len([d for d in deadlines if d.is_overdue])
+            'total_deadlines': total_deadlines,
+            'completed_deadlines': completed_deadlines,
+            'total_tasks': total_tasks,
+            'completed_tasks': completed_tasks,
+            'overdue_items': overdue_items
         }
 
     # Deadline Management
@@ -356,41 +1009,65 @@ class CaseManager:
         )
 
         self.deadlines[dl_id] = deadline
+        self._open_deadlines[dl_id] = None
+        self._push_deadline(deadline)
 
         # Add to case
         if deadline.case_id in self.cases:
             self.cases[deadline.case_id].deadlines.append(dl_id)
 
-        self._save_data()
+        self._mark_dirty(('deadlines', dl_id), ('cases', deadline.case_id))
         return deadline
 
-    def get_upcoming_deadlines(self, days: int = 14) -> List[Deadline]:
+    def get_upcoming_deadlines(self, days: int = 14, today: Optional[date] = None) -> List[Deadline]:
         """Get all deadlines within the next N days"""
-        cutoff = datetime.now() + timedelta(days=days)
+        cutoff = (today or date.today()).toordinal() + days
+        return self._open_deadlines_due_by(cutoff)
 
-        upcoming = []
-        for deadline in self.deadlines.values():
-            if deadline.completed:
-                continue
+    def get_overdue_deadlines(self, today: Optional[date] = None) -> List[Deadline]:
+        """Get all overdue deadlines"""
+        return self._open_deadlines_due_by((today or date.today()).toordinal() - 1)
 
+    def get_urgency_counts(self, today: Optional[date] = None) -> Dict[str, int]:
+        """Count open deadlines per urgency level"""
+        due_ordinals = []
+        for dl_id in self._open_deadlines:
             try:
-                due = datetime.strptime(deadline.due_date, "%Y-%m-%d")
-                if due <= cutoff:
-                    upcoming.append(deadline)
-            except:
+                due_ordinals.append(self.deadlines[dl_id].due_ordinal)
+            except (TypeError, ValueError):
                 pass
 
-        return sorted(upcoming, key=lambda d: d.due_date)
+        days = np.array(due_ordinals, dtype=np.int64) - (today or date.today()).toordinal()
+        buckets = np.bincount(np.digitize(days, URGENCY_BOUNDS), minlength=len(URGENCY_LEVELS))
+        return dict(zip(URGENCY_LEVELS, buckets.tolist()))
 
-    def get_overdue_deadlines(self) -> List[Deadline]:
-        """Get all overdue deadlines"""
-        return [d for d in self.deadlines.values() if d.is_overdue]
+    def update_deadline(self, deadline_id: str, updates: Dict) -> Optional[Deadline]:
+        """Update a deadline"""
+        if deadline_id not in self.deadlines:
+            return None
+
+        deadline = self.deadlines[deadline_id]
+        for key, value in updates.items():
+            if hasattr(deadline, key):
+                setattr(deadline, key, value)
+
+        if deadline.completed:
+            self._open_deadlines.pop(deadline_id, None)
+        elif 'due_date' in updates or 'completed' in updates:
+            # Push under the (possibly new) date so a move to an earlier day is seen;
+            # the entry for the old date is dropped when it is popped
+            self._open_deadlines[deadline_id] = None
+            self._push_deadline(deadline)
+
+        self._mark_dirty(('deadlines', deadline_id))
+        return deadline
 
     def complete_deadline(self, deadline_id: str) -> Optional[Deadline]:
         """Mark a deadline as completed"""
         if deadline_id in self.deadlines:
             self.deadlines[deadline_id].completed = True
-            self._save_data()
+            self._open_deadlines.pop(deadline_id, None)
+            self._mark_dirty(('deadlines', deadline_id))
             return self.deadlines[deadline_id]
         return None
 
@@ -413,12 +1090,13 @@ class CaseManager:
         )
 
         self.tasks[task_id] = task
+        self._index_task(task)
 
         # Add to case
         if task.case_id in self.cases:
             self.cases[task.case_id].tasks.append(task_id)
 
-        self._save_data()
+        self._mark_dirty(('tasks', task_id), ('cases', task.case_id))
         return task
 
     def update_task(self, task_id: str, updates: Dict) -> Optional[Task]:
@@ -427,28 +1105,33 @@ class CaseManager:
             return None
 
         task = self.tasks[task_id]
+        self._unindex_task(task)
         for key, value in updates.items():
             if hasattr(task, key):
                 setattr(task, key, value)
+        self._index_task(task)
 
-        if updates.get('status') == 'Completed':
+        if updates.get('status') == TaskStatus.COMPLETED.value:
             task.completed_date = datetime.now().isoformat()
 
-        self._save_data()
+        self._mark_dirty(('tasks', task_id))
         return task
 
     def get_pending_tasks(self, case_id: str = None) -> List[Task]:
         """Get pending tasks, optionally for a specific case"""
-        tasks = list(self.tasks.values())
+        pending_ids = [t for status in OPEN_TASK_STATUSES
+                       for t in self._tasks_by_status.get(status, ())]
 
         if case_id:
-            tasks = [t for t in tasks if t.case_id == case_id]
+            case_tasks = self._tasks_by_case.get(case_id, {})
+            pending_ids = [t for t in pending_ids if t in case_tasks]
 
-        pending = [t for t in tasks if t.status in ['Pending', 'In Progress']]
+        pending = [self.tasks[t] for t in pending_ids]
 
         # Sort by priority and due date
-        priority_order = {'Urgent': 0, 'High': 1, 'Medium': 2, 'Low': 3}
-        return sorted(pending, key=lambda t: (priority_order.get(t.priority, 2), t.due_date or '9999'))
+        rank = PRIORITY_ORDER.get
+        return sorted(pending, key=lambda t: (rank(t.priority, DEFAULT_PRIORITY_RANK), t.due_date or '9999',
+                                             t.created_date))
 
     # Notes
     def add_note(self, note_data: Dict) -> CaseNote:
@@ -470,53 +1153,61 @@ class CaseManager:
         if note.case_id in self.cases:
             self.cases[note.case_id].notes.append(note_id)
 
-        self._save_data()
+        self._mark_dirty(('notes', note_id), ('cases', note.case_id))
         return note
 
     # Dashboard / Reports
     def get_dashboard_data(self) -> Dict:
         """Get data for dashboard display"""
-        active_cases = [c for c in self.cases.values()
-                       if c.status not in ['Closed', 'On Hold']]
+        inactive_count = sum(len(self._cases_by_status.get(s, ())) for s in INACTIVE_CASE_STATUSES)
 
-        overdue = self.get_overdue_deadlines()
-        upcoming = self.get_upcoming_deadlines(7)  # Next 7 days
+        today = date.today()
+        # Next 7 days; sorted by due date, so the overdue ones form its prefix
+        upcoming = self.get_upcoming_deadlines(7, today)
+        overdue_count = bisect_right([d.due_ordinal for d in upcoming], today.toordinal() - 1)
+        overdue = upcoming[:overdue_count]
         pending_tasks = self.get_pending_tasks()
-
-        # Calculate workload
-        urgent_tasks = [t for t in pending_tasks if t.priority == 'Urgent']
-        high_tasks = [t for t in pending_tasks if t.priority == 'High']
-
-        # Cases by status
-        status_counts = {}
-        for case in self.cases.values():
-            status_counts[case.status] = status_counts.get(case.status, 0) + 1
-
-        # Cases by type
-        type_counts = {}
-        for case in self.cases.values():
-            type_counts[case.case_type] = type_counts.get(case.case_type, 0) + 1
+        urgency_counts = self.get_urgency_counts(today)
+
+        # Calculate workload in one pass over the pending tasks
+        urgent = TaskPriority.URGENT.value
+        high = TaskPriority.HIGH.value
+        urgent_tasks = []
+        high_count = 0
+        for task in pending_tasks:
+            if task.priority == urgent:
+                urgent_tasks.append(task)
+            elif task.priority == high:
+                high_count += 1
+
+        # Cases by status and type
+        status_counts = {s: len(ids) for s, ids in self._cases_by_status.items() if ids}
+        type_counts = {t: len(ids) for t, ids in self._cases_by_type.items() if ids}
 
         return {
             'total_cases': len(self.cases),
-            'active_cases': len(active_cases),
+            'active_cases': len(self.cases) - inactive_count,
             'overdue_deadlines': len(overdue),
             'upcoming_deadlines': len(upcoming),
             'pending_tasks': len(pending_tasks),
             'urgent_tasks': len(urgent_tasks),
-            'high_priority_tasks': len(high_tasks),
+            'high_priority_tasks': high_count,
             'status_breakdown': status_counts,
             'type_breakdown': type_counts,
+            'urgency_breakdown': urgency_counts,
             'overdue_list': overdue[:5],
             'upcoming_list': upcoming[:5],
-            'urgent_task_list': urgent_tasks[:5]
+            'urgent_task_list': urgent_tasks[:5],
+            'as_of': today
         }
 
     def generate_weekly_report(self) -> str:
         """Generate a weekly status report"""
         dashboard = self.get_dashboard_data()
 
-        report = f"""
+        today = dashboard['as_of']
+
+        parts = [f"""
 {'=' * 60}
             WEEKLY CASE STATUS REPORT
             Generated: {datetime.now().strftime("%B %d, %Y")}
@@ -533,43 +1224,43 @@ Pending Tasks: {dashboard['pending_tasks']}
 
 CASES BY STATUS
 ---------------
-"""
+"""]
         for status, count in dashboard['status_breakdown'].items():
-            report += f"  {status}: {count}\n"
+            parts.append(f"  {status}: {count}\n")
 
-        report += """
+        parts.append("""
 CASES BY TYPE
 -------------
-"""
+""")
         for case_type, count in dashboard['type_breakdown'].items():
-            report += f"  {case_type}: {count}\n"
+            parts.append(f"  {case_type}: {count}\n")
 
         if dashboard['overdue_list']:
-            report += """
+            parts.append("""
 OVERDUE DEADLINES (Action Required)
 -----------------------------------
-"""
+""")
             for dl in dashboard['overdue_list']:
                 case = self.cases.get(dl.case_id)
                 client = case.client_name if case else "Unknown"
-                report += f"  ⚠️ {dl.title} - {client}\n"
-                report += f"     Due: {dl.due_date} ({abs(dl.days_until_due)} days overdue)\n"
+                parts.append(f"  ⚠️ {dl.title} - {client}\n")
+                parts.append(f"     Due: {dl.due_date} ({abs(dl.days_until(today))} days overdue)\n")
 
         if dashboard['upcoming_list']:
-            report += """
+            parts.append("""
 UPCOMING DEADLINES (Next 7 Days)
 --------------------------------
-"""
+""")
             for dl in dashboard['upcoming_list']:
                 case = self.cases.get(dl.case_id)
                 client = case.client_name if case else "Unknown"
-                report += f"  📅 {dl.title} - {client}\n"
-                report += f"     Due: {dl.due_date} ({dl.days_until_due} days)\n"
+                parts.append(f"  📅 {dl.title} - {client}\n")
+                parts.append(f"     Due: {dl.due_date} ({dl.days_until(today)} days)\n")
 
-        report += f"""
+        parts.append(f"""
 {'=' * 60}
-"""
-        return report
+""")
+        return "".join(parts)
 
 
 def create_case_manager() -> CaseManager:
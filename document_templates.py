@@ -12,12 +12,21 @@ Templates for:
 - Stipulation of Settlement
 """
 
-from datetime import datetime
-from typing import Dict, List, Optional
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from string import Formatter
+from typing import IO, Collection, Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache, partial
 
 
-@dataclass
+# Immutable, hashable party records; slotted (no per-instance __dict__)
+# where the interpreter supports it
+RECORD_OPTIONS = {'frozen': True, 'slots': True} if sys.version_info >= (3, 10) else {'frozen': True}
+
+
+@dataclass(**RECORD_OPTIONS)
 class PartyInfo:
     """Information about a party in the case"""
     name: str
@@ -33,8 +42,28 @@ class PartyInfo:
     employer_address: str = ""
     occupation: str = ""
 
+    @property
+    def first_name(self) -> str:
+        """First word of the name, used in letter salutations"""
+        return self.name.split(None, 1)[0]
 
-@dataclass
+    @property
+    def last_name(self) -> str:
+        """Last word of the name, used in formal salutations"""
+        return self.name.rsplit(None, 1)[-1]
+
+    @property
+    def city_line(self) -> str:
+        """City, state and ZIP on one line"""
+        return f"{self.city}, {self.state} {self.zip_code}"
+
+    @property
+    def address_line(self) -> str:
+        """Full mailing address on one line"""
+        return f"{self.address}, {self.city_line}"
+
+
+@dataclass(**RECORD_OPTIONS)
 class ChildInfo:
     """Information about a child"""
     name: str
@@ -46,35 +75,247 @@ class ChildInfo:
     special_needs_desc: str = ""
 
 
-class DocumentTemplates:
-    """Generate NY Family Law document templates"""
+@dataclass
+class DocSpec:
+    """One document in a generate_documents batch. Not hashable: params is a
+    plain dict of keyword arguments for the generator."""
+    document: str  # generator name without the prefix, e.g. 'notice_of_appearance'
+    params: Dict
+
+
+# Family Court Act §812 offenses listed on the family offense petition
+FAMILY_OFFENSES = (
+    "Disorderly Conduct (PL §240.20)",
+    "Harassment in the First Degree (PL §240.25)",
+    "Harassment in the Second Degree (PL §240.26)",
+    "Aggravated Harassment in the Second Degree (PL §240.30)",
+    "Menacing in the Second Degree (PL §120.14)",
+    "Menacing in the Third Degree (PL §120.15)",
+    "Reckless Endangerment (PL §120.20)",
+    "Assault in the Second Degree (PL §120.05)",
+    "Assault in the Third Degree (PL §120.00)",
+    "Attempted Assault (PL §110/120.00)",
+    "Stalking in the First Degree (PL §120.60)",
+    "Stalking in the Second Degree (PL §120.55)",
+    "Stalking in the Third Degree (PL §120.50)",
+    "Stalking in the Fourth Degree (PL §120.45)",
+    "Criminal Mischief (PL §145.00-145.12)",
+    "Strangulation in the First Degree (PL §121.13)",
+    "Strangulation in the Second Degree (PL §121.12)",
+    "Criminal Obstruction of Breathing (PL §121.11)",
+    "Identity Theft (PL §190.78-190.80)",
+    "Grand Larceny (PL §155.30-155.42)",
+    "Coercion (PL §135.60-135.65)",
+)
+
+# Shared snippets expanded into templates at compile time, so they are written
+# once and never passed (or re-interpolated) on each render
+RULE = "=" * 75
+TEMPLATE_PARTIALS = {
+    'rule': RULE,
+    'supreme_court_header': """\
+{rule}
+                    SUPREME COURT OF THE STATE OF NEW YORK
+                           COUNTY OF {county_upper}
+{rule}""",
+    'venue': """\
+STATE OF NEW YORK    )
+                     ) ss.:
+COUNTY OF {county_upper}    )""",
+    'family_offenses': "\n".join(f"   [ ] {offense}" for offense in FAMILY_OFFENSES),
+}
+
+# List item markers used when building variable-length lists
+BULLET = "        • "
+CHECKBOX = "        [ ] "
+DOCUMENT_CHECKBOX = "        □ "
+
+
+def marked_lines(marker: str, items: List[str]) -> str:
+    """Render items one per line, each prefixed with a list marker"""
+    return marker + ("\n" + marker).join(items) if items else ""
+
+
+def numbered_lines(items: List[str]) -> str:
+    """Render items as an indented list numbered from 1"""
+    return "\n".join(f"        {number}. {item}" for number, item in enumerate(items, 1))
+
+
+@lru_cache(maxsize=16)
+def _format_day(ordinal: int) -> str:
+    """Format a day ordinal the way letters print their date"""
+    return date.fromordinal(ordinal).strftime("%B %d, %Y")
+
+
+def today_string(as_of: Optional[date] = None) -> str:
+    """The date documents bear (today unless as_of is given), formatted once per day"""
+    return _format_day((as_of or date.today()).toordinal())
+
+
+# Approximate size of the pieces CompiledTemplate.iter_render yields
+STREAM_CHUNK_SIZE = 2048
+
+
+class CompiledTemplate:
+    """str.format template compiled once into a keyword-only render function"""
+
+    def __init__(self, source: str, partials: Optional[Dict[str, str]] = None):
+        self.source = source
+        self.fields: List[str] = []
+        parts: List[str] = []
+        self._compile(source, TEMPLATE_PARTIALS if partials is None else partials, parts)
+
+        # The body becomes a single f-string expression, so rendering costs
+        # the same as the hand-written f-strings the templates replaced.
+        # iter_render yields the same text as a few f-string chunks for
+        # callers streaming straight to a file.
+        chunks = [[]]
+        size = 0
+        for part in parts:
+            if size >= STREAM_CHUNK_SIZE:
+                chunks.append([])
+                size = 0
+            chunks[-1].append(part)
+            size += len(part)
+        params = f"*, {', '.join(self.fields)}" if self.fields else ""
+        yields = "".join(f"    yield f{''.join(chunk)!r}\n" for chunk in chunks)
+        code = (f"def render({params}):\n    return f{''.join(parts)!r}\n"
+                f"def iter_render({params}):\n{yields}")
+        namespace: Dict = {}
+        exec(compile(code, '<document template>', 'exec'), namespace)
+        self.render = namespace['render']
+        self.iter_render = namespace['iter_render']
+
+    def write(self, fp: IO[str], **fields) -> None:
+        """Render the template straight into a text file object"""
+        fp.writelines(self.iter_render(**fields))
+
+    def _compile(self, source: str, partials: Dict[str, str], parts: List[str]):
+        """Translate template source into f-string source, expanding partials"""
+        for literal, field, spec, conversion in Formatter().parse(source):
+            parts.append(literal.replace('{', '{{').replace('}', '}}'))
+            if field is None:
+                continue
+            if field in partials and not spec and not conversion:
+                self._compile(partials[field], partials, parts)
+                continue
+            name = field.split('.', 1)[0]
+            if not name.isidentifier() or '[' in field:
+                raise ValueError(f"Unsupported template field: {field!r}")
+            if name not in self.fields:
+                self.fields.append(name)
+            conversion = f"!{conversion}" if conversion else ""
+            spec = f":{spec}" if spec else ""
+            parts.append(f"{{{field}{conversion}{spec}}}")
+
+
+def render_sections(templates: Dict[str, CompiledTemplate], names: Collection[str],
+                    fields: Dict) -> str:
+    """Render the named sections of a sectioned document, in document order"""
+    unknown = set(names).difference(templates)
+    if unknown:
+        raise ValueError(f"Unknown document sections: {', '.join(sorted(unknown))}")
+    return "".join(template.render(**{field: fields[field] for field in template.fields})
+                   for name, template in templates.items() if name in names)
+
+
+# Per-party blocks are pure functions of a (frozen, hashable) PartyInfo, so
+# regenerating several documents for the same parties reuses them
+PARTY_BLOCK_TEMPLATES = {
+    'deponent': CompiledTemplate("""\
+Name: {party.name}
+Address: {party.address}
+         {party.city_line}
+Telephone: {party.phone}
+Email: {party.email}
+Date of Birth: {party.dob}
+Social Security Number (last 4): XXX-XX-{party.ssn_last4}
 
-    def __init__(self, firm_name: str = "The White Law Group",
-                 firm_address: str = "4 Brower Ave Suite 3, Woodmere, NY 11598",
-                 firm_phone: str = "(347) 628-5440"):
-        self.firm_name = firm_name
-        self.firm_address = firm_address
-        self.firm_phone = firm_phone
+Employer: {party.employer}
+Employer Address: {party.employer_address}
+Occupation: {party.occupation}"""),
+    'spouse': CompiledTemplate("""\
+Name: {party.name}
+Address: {party.address}
+         {party.city_line}
+Date of Birth: {party.dob}
+Social Security Number (last 4): XXX-XX-{party.ssn_last4}
+Employer: {party.employer}"""),
+    'petition': CompiledTemplate("""\
+   Name: {party.name}
+   Address: {party.address}
+            {party.city_line}
+   Telephone: {party.phone}
+   Date of Birth: {party.dob}"""),
+}
 
-    def generate_net_worth_statement(self,
-                                     party: PartyInfo,
-                                     spouse: PartyInfo,
-                                     county: str,
-                                     index_number: str,
-                                     income_data: Dict,
-                                     assets: Dict,
-                                     liabilities: Dict,
-                                     expenses: Dict) -> str:
-        """
-        Generate Net Worth Statement per DRL 236 and 22 NYCRR 202.16(b)
-        """
-        today = datetime.now().strftime("%B %d, %Y")
 
-        template = f"""
-{'=' * 75}
-                    SUPREME COURT OF THE STATE OF NEW YORK
-                           COUNTY OF {county.upper()}
-{'=' * 75}
+@lru_cache(maxsize=512)
+def render_party_block(party: PartyInfo, style: str) -> str:
+    """Render a party information block in the given style"""
+    return PARTY_BLOCK_TEMPLATES[style].render(party=party)
+
+
+NO_CHILDREN_CLAUSE = """
+FIFTH: There are no children born of this marriage.
+"""
+
+CHILDREN_CLAUSE_HEADER = """
+FIFTH: The following child(ren) were born of this marriage:
+
+"""
+
+COMPLAINT_CHILD_TEMPLATE = CompiledTemplate("""
+    Child {number}:
+    Name: {child.name}
+    Date of Birth: {child.dob}
+    Age: {child.age}
+    Currently Residing With: {child.residence}
+""")
+
+
+@lru_cache(maxsize=256)
+def render_complaint_children(children: Tuple[ChildInfo, ...]) -> str:
+    """Render the complaint paragraph listing the children of the marriage"""
+    if not children:
+        return NO_CHILDREN_CLAUSE
+    return CHILDREN_CLAUSE_HEADER + "".join(
+        COMPLAINT_CHILD_TEMPLATE.render(number=i, child=child)
+        for i, child in enumerate(children, 1)
+    )
+
+
+# Firm letterhead, contact lines and signature block, rendered once per
+# DocumentTemplates
+LETTERHEAD_TEMPLATE = CompiledTemplate("""\
+{rule}
+                        {firm_name_upper}
+                        ATTORNEYS AT LAW
+{rule}
+
+{firm_address}
+{firm_phone}""")
+
+FIRM_CONTACT_TEMPLATE = CompiledTemplate("""\
+{firm_name}
+{firm_address}
+{firm_phone}""")
+
+SIGNATURE_BLOCK_TEMPLATE = CompiledTemplate("""\
+                                        {firm_name}
+                                        Attorneys for Plaintiff
+
+                                        By: _________________________
+
+                                        {firm_address}
+                                        {firm_phone}""")
+
+
+# Document bodies live at module level and are compiled once at import
+# instead of being rebuilt inside every generate_* call.
+
+NET_WORTH_STATEMENT_TEMPLATE = CompiledTemplate("""
+{supreme_court_header}
 
 {party.name},
                                                     Plaintiff,
@@ -82,22 +323,20 @@ class DocumentTemplates:
 
 {spouse.name},
                                                     Defendant.
-{'=' * 75}
+{rule}
 
                          SWORN STATEMENT OF NET WORTH
                     Pursuant to DRL 236(B) and 22 NYCRR 202.16(b)
 
-{'=' * 75}
+{rule}
 
-STATE OF NEW YORK    )
-                     ) ss.:
-COUNTY OF {county.upper()}    )
+{venue}
 
 I, {party.name}, being duly sworn, depose and say:
 
-{'=' * 75}
+{rule}
                            PART I - BACKGROUND
-{'=' * 75}
+{rule}
 
 1. DATE OF COMMENCEMENT OF ACTION: _______________
 
@@ -114,37 +353,22 @@ I, {party.name}, being duly sworn, depose and say:
 6. CUSTODY REQUESTED BY:
    [ ] Plaintiff  [ ] Defendant  [ ] Joint  [ ] Other
 
-{'=' * 75}
+{rule}
                         PART II - PARTY INFORMATION
-{'=' * 75}
+{rule}
 
 DEPONENT'S INFORMATION:
 
-Name: {party.name}
-Address: {party.address}
-         {party.city}, {party.state} {party.zip_code}
-Telephone: {party.phone}
-Email: {party.email}
-Date of Birth: {party.dob}
-Social Security Number (last 4): XXX-XX-{party.ssn_last4}
-
-Employer: {party.employer}
-Employer Address: {party.employer_address}
-Occupation: {party.occupation}
+{deponent_block}
 
 SPOUSE'S INFORMATION:
 
-Name: {spouse.name}
-Address: {spouse.address}
-         {spouse.city}, {spouse.state} {spouse.zip_code}
-Date of Birth: {spouse.dob}
-Social Security Number (last 4): XXX-XX-{spouse.ssn_last4}
-Employer: {spouse.employer}
+{spouse_block}
 
-{'=' * 75}
+{rule}
                            PART III - GROSS INCOME
                     (From all sources for prior calendar year)
-{'=' * 75}
+{rule}
 
                                         HUSBAND         WIFE
                                         --------        --------
@@ -161,9 +385,9 @@ Employer: {spouse.employer}
 
 TOTAL GROSS INCOME:                     $________       $________
 
-{'=' * 75}
+{rule}
                               SCHEDULE A - ASSETS
-{'=' * 75}
+{rule}
 
 A. REAL PROPERTY
    ---------------------------------------------------------------------------
@@ -222,9 +446,9 @@ H. OTHER ASSETS (jewelry, art, collectibles, etc.)
 
 TOTAL ASSETS:                                      $______________
 
-{'=' * 75}
+{rule}
                            SCHEDULE B - LIABILITIES
-{'=' * 75}
+{rule}
 
 A. MORTGAGE(S)
    ---------------------------------------------------------------------------
@@ -272,18 +496,18 @@ G. OTHER LIABILITIES
 
 TOTAL LIABILITIES:                              $______________
 
-{'=' * 75}
+{rule}
                               NET WORTH SUMMARY
-{'=' * 75}
+{rule}
 
 TOTAL ASSETS:                                   $______________
 LESS: TOTAL LIABILITIES:                        $______________
                                                 ---------------
 NET WORTH:                                      $______________
 
-{'=' * 75}
+{rule}
                          SCHEDULE C - MONTHLY EXPENSES
-{'=' * 75}
+{rule}
 
 HOUSING:
   Mortgage/Rent                                 $______________
@@ -330,9 +554,9 @@ OTHER EXPENSES:
 
 TOTAL MONTHLY EXPENSES:                         $______________
 
-{'=' * 75}
+{rule}
                               VERIFICATION
-{'=' * 75}
+{rule}
 
 I, {party.name}, affirm under the penalties of perjury under the
 laws of New York, which may include a fine or imprisonment, that the
@@ -358,58 +582,20 @@ _____ day of _____________, 20___
 _________________________________
 Notary Public
 
-{'=' * 75}
+{rule}
 
 PREPARED BY:
 
-{self.firm_name}
-{self.firm_address}
-{self.firm_phone}
+{firm_contact}
 
 Attorney for: [ ] Plaintiff  [ ] Defendant
 
-{'=' * 75}
-"""
-        return template
-
-    def generate_verified_complaint(self,
-                                   plaintiff: PartyInfo,
-                                   defendant: PartyInfo,
-                                   county: str,
-                                   marriage_date: str,
-                                   marriage_place: str,
-                                   separation_date: str,
-                                   children: List[ChildInfo],
-                                   grounds: str = "Irretrievable Breakdown") -> str:
-        """
-        Generate Verified Complaint for Divorce (Form UD-2)
-        """
-        today = datetime.now().strftime("%B %d, %Y")
-
-        children_section = ""
-        if children:
-            children_section = """
-FIFTH: The following child(ren) were born of this marriage:
+{rule}
+""")
 
-"""
-            for i, child in enumerate(children, 1):
-                children_section += f"""
-    Child {i}:
-    Name: {child.name}
-    Date of Birth: {child.dob}
-    Age: {child.age}
-    Currently Residing With: {child.residence}
-"""
-        else:
-            children_section = """
-FIFTH: There are no children born of this marriage.
-"""
 
-        template = f"""
-{'=' * 75}
-                    SUPREME COURT OF THE STATE OF NEW YORK
-                           COUNTY OF {county.upper()}
-{'=' * 75}
+VERIFIED_COMPLAINT_TEMPLATE = CompiledTemplate("""
+{supreme_court_header}
 
 {plaintiff.name},
                                                     Plaintiff,
@@ -417,14 +603,14 @@ FIFTH: There are no children born of this marriage.
 
 {defendant.name},
                                                     Defendant.
-{'=' * 75}
+{rule}
 
                            VERIFIED COMPLAINT FOR DIVORCE
                               (DRL Section 170)
 
-{'=' * 75}
+{rule}
 
-Plaintiff, by his/her attorneys, {self.firm_name}, complaining of the
+Plaintiff, by his/her attorneys, {firm_name}, complaining of the
 Defendant, respectfully alleges upon information and belief:
 
 FIRST: The Plaintiff has resided in the State of New York for a
@@ -511,21 +697,13 @@ WHEREFORE, Plaintiff demands judgment against the Defendant:
     and proper.
 
 
-                                        {self.firm_name}
-                                        Attorneys for Plaintiff
-
-                                        By: _________________________
-
-                                        {self.firm_address}
-                                        {self.firm_phone}
+{signature_block}
 
-{'=' * 75}
+{rule}
                               VERIFICATION
-{'=' * 75}
+{rule}
 
-STATE OF NEW YORK    )
-                     ) ss.:
-COUNTY OF {county.upper()}    )
+{venue}
 
 {plaintiff.name}, being duly sworn, deposes and says:
 
@@ -548,61 +726,21 @@ _____ day of _____________, 20___
 _________________________________
 Notary Public
 
-{'=' * 75}
-"""
-        return template
+{rule}
+""")
 
-    def generate_child_support_worksheet(self,
-                                        custodial_parent: PartyInfo,
-                                        non_custodial_parent: PartyInfo,
-                                        county: str,
-                                        children: List[ChildInfo],
-                                        custodial_income: float,
-                                        non_custodial_income: float,
-                                        childcare_cost: float = 0,
-                                        health_insurance: float = 0,
-                                        education_cost: float = 0) -> str:
-        """
-        Generate Child Support Standards Act (CSSA) Worksheet
-        """
-        num_children = len(children)
-
-        # CSSA percentages
-        cssa_rates = {1: 0.17, 2: 0.25, 3: 0.29, 4: 0.31, 5: 0.35}
-        cssa_pct = cssa_rates.get(num_children, 0.35)
-
-        combined_income = custodial_income + non_custodial_income
-        cssa_cap = 183000  # 2024 cap
-
-        # Calculate shares
-        if combined_income > 0:
-            custodial_share = custodial_income / combined_income
-            non_custodial_share = non_custodial_income / combined_income
-        else:
-            custodial_share = 0.5
-            non_custodial_share = 0.5
-
-        # Basic support calculation
-        income_for_calc = min(combined_income, cssa_cap)
-        basic_support = income_for_calc * cssa_pct
-        ncp_basic_support = basic_support * non_custodial_share
-
-        # Add-ons (pro rata share)
-        total_addons = childcare_cost + health_insurance + education_cost
-        ncp_addons = total_addons * non_custodial_share
-
-        total_support = ncp_basic_support + ncp_addons
 
-        children_list = "\n".join([
-            f"    {i+1}. {c.name}, DOB: {c.dob}, Age: {c.age}"
-            for i, c in enumerate(children)
-        ])
+# CSSA percentages by number of children (5+ children and unlisted counts
+# use the 35% rate) and the 2024 combined parental income cap
+CSSA_RATES = {1: 0.17, 2: 0.25, 3: 0.29, 4: 0.31, 5: 0.35}
+CSSA_DEFAULT_RATE = 0.35
+CSSA_INCOME_CAP = 183000
 
-        template = f"""
-{'=' * 75}
+CHILD_SUPPORT_WORKSHEET_TEMPLATE = CompiledTemplate("""
+{rule}
                     CHILD SUPPORT STANDARDS ACT WORKSHEET
                          (DRL §240(1-b); FCA §413)
-{'=' * 75}
+{rule}
 
 COURT: Supreme Court / Family Court
 COUNTY: {county}
@@ -616,9 +754,9 @@ CHILD(REN) SUBJECT TO THIS ORDER:
 
 NUMBER OF CHILDREN: {num_children}
 
-{'=' * 75}
+{rule}
                          PART I - INCOME CALCULATION
-{'=' * 75}
+{rule}
 
                                     CUSTODIAL       NON-CUSTODIAL
                                     PARENT          PARENT
@@ -634,9 +772,9 @@ NUMBER OF CHILDREN: {num_children}
 
 5. COMBINED PARENTAL INCOME:        ${combined_income:>12,.2f}
 
-{'=' * 75}
+{rule}
                       PART II - BASIC CHILD SUPPORT
-{'=' * 75}
+{rule}
 
 6. Combined Parental Income (Line 5):           ${combined_income:>12,.2f}
 
@@ -645,7 +783,7 @@ NUMBER OF CHILDREN: {num_children}
 8. Income Subject to CSSA Calculation:          ${income_for_calc:>12,.2f}
    (Lesser of Line 6 or Line 7)
 
-9. CSSA Percentage for {num_children} child(ren):              {cssa_pct * 100:.0f}%
+9. CSSA Percentage for {num_children} child(ren):              {cssa_percent:.0f}%
 
    (1 child = 17%, 2 children = 25%, 3 children = 29%,
     4 children = 31%, 5+ children = 35%)
@@ -653,39 +791,39 @@ NUMBER OF CHILDREN: {num_children}
 10. Combined Basic Child Support (Line 8 x Line 9):  ${basic_support:>12,.2f}
 
 11. Pro Rata Shares:
-    Custodial Parent:     {custodial_share * 100:>6.1f}%
-    Non-Custodial Parent: {non_custodial_share * 100:>6.1f}%
+    Custodial Parent:     {custodial_percent:>6.1f}%
+    Non-Custodial Parent: {non_custodial_percent:>6.1f}%
 
 12. NON-CUSTODIAL PARENT'S BASIC SUPPORT:       ${ncp_basic_support:>12,.2f}
     (Line 10 x Non-Custodial Share)
 
-{'=' * 75}
+{rule}
                         PART III - ADD-ON EXPENSES
               (Pro Rata Share Paid by Non-Custodial Parent)
-{'=' * 75}
+{rule}
 
 13. Child Care Expenses
     (work-related, reasonable)                  ${childcare_cost:>12,.2f}
-    Non-Custodial Share ({non_custodial_share * 100:.1f}%):         ${childcare_cost * non_custodial_share:>12,.2f}
+    Non-Custodial Share ({ncp_share_label}):         ${ncp_childcare:>12,.2f}
 
 14. Health Insurance Premium
     (for child(ren))                            ${health_insurance:>12,.2f}
-    Non-Custodial Share ({non_custodial_share * 100:.1f}%):         ${health_insurance * non_custodial_share:>12,.2f}
+    Non-Custodial Share ({ncp_share_label}):         ${ncp_health_insurance:>12,.2f}
 
 15. Unreimbursed Health Care Expenses
     (reasonable, necessary)                     $____________
-    Non-Custodial Share ({non_custodial_share * 100:.1f}%):         $____________
+    Non-Custodial Share ({ncp_share_label}):         $____________
 
 16. Educational Expenses
     (special needs, private school if agreed)   ${education_cost:>12,.2f}
-    Non-Custodial Share ({non_custodial_share * 100:.1f}%):         ${education_cost * non_custodial_share:>12,.2f}
+    Non-Custodial Share ({ncp_share_label}):         ${ncp_education:>12,.2f}
 
 17. TOTAL ADD-ON EXPENSES:                      ${total_addons:>12,.2f}
     NON-CUSTODIAL PARENT'S SHARE:               ${ncp_addons:>12,.2f}
 
-{'=' * 75}
+{rule}
                          PART IV - TOTAL SUPPORT
-{'=' * 75}
+{rule}
 
 18. Non-Custodial Parent's Basic Support
     (Line 12):                                  ${ncp_basic_support:>12,.2f}
@@ -696,27 +834,27 @@ NUMBER OF CHILDREN: {num_children}
 20. TOTAL CHILD SUPPORT OBLIGATION:             ${total_support:>12,.2f}
                                                 ===============
 
-    MONTHLY PAYMENT:                            ${total_support / 12:>12,.2f}
+    MONTHLY PAYMENT:                            ${monthly_payment:>12,.2f}
 
-    BI-WEEKLY PAYMENT:                          ${total_support / 26:>12,.2f}
+    BI-WEEKLY PAYMENT:                          ${biweekly_payment:>12,.2f}
 
-    WEEKLY PAYMENT:                             ${total_support / 52:>12,.2f}
+    WEEKLY PAYMENT:                             ${weekly_payment:>12,.2f}
 
-{'=' * 75}
+{rule}
                     PART V - ABOVE-CAP INCOME (If Applicable)
-{'=' * 75}
+{rule}
 
 21. Combined Income Above Cap
-    (Line 6 minus Line 7, if positive):         ${max(0, combined_income - cssa_cap):>12,.2f}
+    (Line 6 minus Line 7, if positive):         ${above_cap_income:>12,.2f}
 
 22. Additional Support for Above-Cap Income
     (Court's discretion based on factors
     in DRL 240(1-b)(f)):                        $____________
 
-{'=' * 75}
+{rule}
                           DEVIATION FACTORS
                     (DRL §240(1-b)(f) - Court may consider)
-{'=' * 75}
+{rule}
 
 [ ] Financial resources of custodial parent
 [ ] Physical and emotional health of child
@@ -734,9 +872,9 @@ DEVIATION REQUESTED:    [ ] Yes    [ ] No
 If yes, explain: ___________________________________________________
 ____________________________________________________________________
 
-{'=' * 75}
+{rule}
                               SIGNATURES
-{'=' * 75}
+{rule}
 
 _________________________________          _______________
 {custodial_parent.name}                    Date
@@ -755,58 +893,40 @@ Attorney for Custodial Parent              Date
 _________________________________          _______________
 Attorney for Non-Custodial Parent          Date
 
-{'=' * 75}
+{rule}
 
-PREPARED BY:
-{self.firm_name}
-{self.firm_address}
-{self.firm_phone}
+{prepared_by}
 
-{'=' * 75}
-"""
-        return template
+{rule}
+""")
 
-    def generate_family_offense_petition(self,
-                                        petitioner: PartyInfo,
-                                        respondent: PartyInfo,
-                                        county: str,
-                                        relationship: str,
-                                        incidents: List[Dict],
-                                        relief_requested: List[str]) -> str:
-        """
-        Generate Family Offense Petition for Order of Protection
-        """
-        today = datetime.now().strftime("%B %d, %Y")
 
-        incidents_text = ""
-        for i, incident in enumerate(incidents, 1):
-            incidents_text += f"""
-INCIDENT {i}:
-Date: {incident.get('date', '_______________')}
-Time: {incident.get('time', '_______________')}
-Location: {incident.get('location', '_______________')}
+FAMILY_OFFENSE_INCIDENT_TEMPLATE = CompiledTemplate("""
+INCIDENT {number}:
+Date: {date}
+Time: {time}
+Location: {location}
 
 Description of what happened:
-{incident.get('description', '_' * 60)}
+{description}
 
 Injuries sustained (if any):
-{incident.get('injuries', 'None' if not incident.get('injuries') else incident.get('injuries'))}
+{injuries}
 
 Witnesses (if any):
-{incident.get('witnesses', 'None' if not incident.get('witnesses') else incident.get('witnesses'))}
+{witnesses}
 
 Police called: [ ] Yes  [ ] No
-If yes, precinct/report number: {incident.get('police_report', '_______________')}
+If yes, precinct/report number: {police_report}
 
-"""
+""")
 
-        relief_text = "\n".join([f"    [X] {r}" for r in relief_requested])
 
-        template = f"""
-{'=' * 75}
+FAMILY_OFFENSE_PETITION_TEMPLATE = CompiledTemplate("""
+{rule}
                          FAMILY COURT OF THE STATE OF NEW YORK
-                                COUNTY OF {county.upper()}
-{'=' * 75}
+                                COUNTY OF {county_upper}
+{rule}
 
 In the Matter of a Proceeding Under
 Article 8 of the Family Court Act
@@ -817,12 +937,12 @@ Article 8 of the Family Court Act
 
 {respondent.name},
                     Respondent.
-{'=' * 75}
+{rule}
 
                            FAMILY OFFENSE PETITION
                   (Pursuant to Article 8, Family Court Act)
 
-{'=' * 75}
+{rule}
 
 TO THE FAMILY COURT:
 
@@ -830,22 +950,14 @@ The undersigned Petitioner respectfully alleges:
 
 1. PETITIONER INFORMATION:
 
-   Name: {petitioner.name}
-   Address: {petitioner.address}
-            {petitioner.city}, {petitioner.state} {petitioner.zip_code}
-   Telephone: {petitioner.phone}
-   Date of Birth: {petitioner.dob}
+{petitioner_block}
 
    [ ] I request that my address be kept CONFIDENTIAL pursuant to
        FCA §154-b (Address Confidentiality Program)
 
 2. RESPONDENT INFORMATION:
 
-   Name: {respondent.name}
-   Address: {respondent.address}
-            {respondent.city}, {respondent.state} {respondent.zip_code}
-   Telephone: {respondent.phone}
-   Date of Birth: {respondent.dob}
+{respondent_block}
 
 3. RELATIONSHIP BETWEEN PARTIES:
 
@@ -867,27 +979,7 @@ The undersigned Petitioner respectfully alleges:
    The Respondent has committed the following family offense(s) against
    the Petitioner (check all that apply):
 
-   [ ] Disorderly Conduct (PL §240.20)
-   [ ] Harassment in the First Degree (PL §240.25)
-   [ ] Harassment in the Second Degree (PL §240.26)
-   [ ] Aggravated Harassment in the Second Degree (PL §240.30)
-   [ ] Menacing in the Second Degree (PL §120.14)
-   [ ] Menacing in the Third Degree (PL §120.15)
-   [ ] Reckless Endangerment (PL §120.20)
-   [ ] Assault in the Second Degree (PL §120.05)
-   [ ] Assault in the Third Degree (PL §120.00)
-   [ ] Attempted Assault (PL §110/120.00)
-   [ ] Stalking in the First Degree (PL §120.60)
-   [ ] Stalking in the Second Degree (PL §120.55)
-   [ ] Stalking in the Third Degree (PL §120.50)
-   [ ] Stalking in the Fourth Degree (PL §120.45)
-   [ ] Criminal Mischief (PL §145.00-145.12)
-   [ ] Strangulation in the First Degree (PL §121.13)
-   [ ] Strangulation in the Second Degree (PL §121.12)
-   [ ] Criminal Obstruction of Breathing (PL §121.11)
-   [ ] Identity Theft (PL §190.78-190.80)
-   [ ] Grand Larceny (PL §155.30-155.42)
-   [ ] Coercion (PL §135.60-135.65)
+{family_offenses}
    [ ] Other: _______________
 
 5. DESCRIPTION OF INCIDENTS:
@@ -943,13 +1035,11 @@ The undersigned Petitioner respectfully alleges:
    [ ] Final Order of Protection for _____ years (maximum 2 years,
        or 5 years with aggravating circumstances)
 
-{'=' * 75}
+{rule}
                               VERIFICATION
-{'=' * 75}
+{rule}
 
-STATE OF NEW YORK    )
-                     ) ss.:
-COUNTY OF {county.upper()}    )
+{venue}
 
 I, {petitioner.name}, being duly sworn, state that I have read the
 foregoing petition and that the contents are true to the best of my
@@ -970,7 +1060,7 @@ _____ day of _____________, 20___
 _________________________________
 Notary Public
 
-{'=' * 75}
+{rule}
 
                          SAFETY PLANNING NOTICE
 
@@ -980,46 +1070,21 @@ National Domestic Violence Hotline: 1-800-799-7233
 NYS Domestic Violence Hotline: 1-800-942-6906
 NYC Domestic Violence Hotline: 1-800-621-HOPE (4673)
 
-{'=' * 75}
+{rule}
 
-PREPARED BY:
-{self.firm_name}
-{self.firm_address}
-{self.firm_phone}
+{prepared_by}
 
-{'=' * 75}
-"""
-        return template
+{rule}
+""")
 
-    def generate_stipulation_of_settlement(self,
-                                          plaintiff: PartyInfo,
-                                          defendant: PartyInfo,
-                                          county: str,
-                                          index_number: str,
-                                          marriage_date: str,
-                                          children: List[ChildInfo],
-                                          custody_arrangement: str,
-                                          child_support_monthly: float,
-                                          maintenance_monthly: float,
-                                          maintenance_duration: str,
-                                          property_division: Dict) -> str:
-        """
-        Generate Stipulation of Settlement for divorce
-        """
-        today = datetime.now().strftime("%B %d, %Y")
 
-        children_section = ""
-        if children:
-            children_section = f"""
+# Article III of the stipulation, with and without children of the marriage
+STIPULATION_CHILDREN_TEMPLATE = CompiledTemplate("""
 ARTICLE III - CHILDREN
 
 3.1 The parties are the parents of the following minor child(ren):
 
-"""
-            for i, child in enumerate(children, 1):
-                children_section += f"    {child.name}, born {child.dob}\n"
-
-            children_section += f"""
+{child_lines}
 3.2 CUSTODY:
     {custody_arrangement}
 
@@ -1030,19 +1095,19 @@ ARTICLE III - CHILDREN
 3.4 DECISION-MAKING:
     [ ] Joint decision-making on major decisions (education, health, religion)
     [ ] Sole decision-making to: _______________
-"""
-        else:
-            children_section = """
+""")
+
+STIPULATION_NO_CHILDREN_ARTICLE = """
 ARTICLE III - CHILDREN
 
 3.1 There are no minor children of this marriage.
 """
 
-        template = f"""
-{'=' * 75}
-                    SUPREME COURT OF THE STATE OF NEW YORK
-                           COUNTY OF {county.upper()}
-{'=' * 75}
+# The stipulation is kept as named sections so callers can render only the
+# parts they need; the full document is compiled from the joined sources
+STIPULATION_SECTION_SOURCES = (
+    ('caption', """
+{supreme_court_header}
 
 {plaintiff.name},
                                                     Plaintiff,
@@ -1050,26 +1115,26 @@ ARTICLE III - CHILDREN
 
 {defendant.name},
                                                     Defendant.
-{'=' * 75}
+{rule}
 
                         STIPULATION OF SETTLEMENT
 
-{'=' * 75}
+{rule}
 
 This STIPULATION OF SETTLEMENT ("Agreement") is entered into this
 _____ day of _____________, 20___, by and between:
 
 {plaintiff.name} ("Plaintiff" or "Wife/Husband")
-Residing at: {plaintiff.address}, {plaintiff.city}, {plaintiff.state} {plaintiff.zip_code}
+Residing at: {plaintiff.address_line}
 
 AND
 
 {defendant.name} ("Defendant" or "Wife/Husband")
-Residing at: {defendant.address}, {defendant.city}, {defendant.state} {defendant.zip_code}
+Residing at: {defendant.address_line}
 
-{'=' * 75}
+{rule}
                               RECITALS
-{'=' * 75}
+{rule}
 
 WHEREAS, the parties were lawfully married on {marriage_date}; and
 
@@ -1087,9 +1152,11 @@ the other party through the exchange of Sworn Statements of Net Worth;
 NOW, THEREFORE, in consideration of the mutual promises and covenants
 contained herein, the parties agree as follows:
 
-{'=' * 75}
+"""),
+    ('general_provisions', """\
+{rule}
                     ARTICLE I - GENERAL PROVISIONS
-{'=' * 75}
+{rule}
 
 1.1 SEPARATION: The parties shall live separate and apart from each
     other, free from interference, authority, and control by the other.
@@ -1101,9 +1168,11 @@ contained herein, the parties agree as follows:
     responsible for his/her own debts incurred after the date of this
     Agreement.
 
-{'=' * 75}
+"""),
+    ('grounds', """\
+{rule}
                     ARTICLE II - GROUNDS FOR DIVORCE
-{'=' * 75}
+{rule}
 
 2.1 The parties consent to the entry of a Judgment of Divorce based
     upon DRL §170(7), the irretrievable breakdown of the marriage for
@@ -1112,11 +1181,15 @@ contained herein, the parties agree as follows:
 2.2 All ancillary issues shall be resolved by this Agreement and
     incorporated but not merged into the Judgment of Divorce.
 
+"""),
+    ('children', """\
 {children_section}
 
-{'=' * 75}
+"""),
+    ('child_support', """\
+{rule}
                     ARTICLE IV - CHILD SUPPORT
-{'=' * 75}
+{rule}
 
 4.1 BASIC CHILD SUPPORT:
     _________________ shall pay to _________________ as child support
@@ -1144,9 +1217,11 @@ contained herein, the parties agree as follows:
     age 21, or upon the earlier occurrence of marriage, death,
     emancipation, or permanent residence away from the custodial parent.
 
-{'=' * 75}
+"""),
+    ('maintenance', """\
+{rule}
                     ARTICLE V - MAINTENANCE/SPOUSAL SUPPORT
-{'=' * 75}
+{rule}
 
 5.1 _________________ shall pay to _________________ as maintenance
     the sum of ${maintenance_monthly:,.2f} per month, payable on the
@@ -1166,9 +1241,11 @@ contained herein, the parties agree as follows:
     (post-2018), maintenance is neither deductible by the payor nor
     includable in the income of the recipient.
 
-{'=' * 75}
+"""),
+    ('equitable_distribution', """\
+{rule}
                     ARTICLE VI - EQUITABLE DISTRIBUTION
-{'=' * 75}
+{rule}
 
 6.1 MARITAL RESIDENCE:
     Property Address: _______________________________________________
@@ -1199,17 +1276,21 @@ contained herein, the parties agree as follows:
     The following debts shall be paid by Plaintiff: ___________________
     The following debts shall be paid by Defendant: ___________________
 
-{'=' * 75}
+"""),
+    ('counsel_fees', """\
+{rule}
                     ARTICLE VII - COUNSEL FEES
-{'=' * 75}
+{rule}
 
 7.1 [ ] Each party shall be responsible for his/her own attorney's fees.
     [ ] _________________ shall pay $____________ toward _________________'s
         attorney's fees.
 
-{'=' * 75}
+"""),
+    ('general_terms', """\
+{rule}
                     ARTICLE VIII - GENERAL PROVISIONS
-{'=' * 75}
+{rule}
 
 8.1 FULL DISCLOSURE: Each party represents that he/she has made full
     and complete disclosure of all assets and liabilities.
@@ -1228,9 +1309,11 @@ contained herein, the parties agree as follows:
 
 8.6 EXECUTION: This Agreement may be executed in counterparts.
 
-{'=' * 75}
+"""),
+    ('signatures', """\
+{rule}
                     ACKNOWLEDGMENT AND SIGNATURES
-{'=' * 75}
+{rule}
 
 IN WITNESS WHEREOF, the parties have executed this Agreement on the
 date first written above.
@@ -1244,9 +1327,9 @@ _________________________________          _______________
 {defendant.name}                           Date
 
 
-{'=' * 75}
+{rule}
                          ATTORNEY CERTIFICATION
-{'=' * 75}
+{rule}
 
 I, _________________________, Esq., attorney for {plaintiff.name},
 certify that I have reviewed this Agreement with my client and that
@@ -1264,13 +1347,11 @@ _________________________________          _______________
 Attorney for Defendant                     Date
 
 
-{'=' * 75}
+{rule}
                            ACKNOWLEDGMENT
-{'=' * 75}
+{rule}
 
-STATE OF NEW YORK    )
-                     ) ss.:
-COUNTY OF {county.upper()}    )
+{venue}
 
 On this _____ day of _____________, 20___, before me personally appeared
 {plaintiff.name}, to me known and known to me to be the individual
@@ -1281,9 +1362,7 @@ _________________________________
 Notary Public
 
 
-STATE OF NEW YORK    )
-                     ) ss.:
-COUNTY OF {county.upper()}    )
+{venue}
 
 On this _____ day of _____________, 20___, before me personally appeared
 {defendant.name}, to me known and known to me to be the individual
@@ -1293,39 +1372,41 @@ acknowledged to me that he/she executed the same.
 _________________________________
 Notary Public
 
-{'=' * 75}
+{rule}
 
-PREPARED BY:
-{self.firm_name}
-{self.firm_address}
-{self.firm_phone}
+{prepared_by}
 
-{'=' * 75}
-"""
-        return template
+{rule}
+"""),
+)
 
+STIPULATION_SECTIONS = {name: CompiledTemplate(source)
+                        for name, source in STIPULATION_SECTION_SOURCES}
 
-    def generate_engagement_letter(self,
-                                   client: PartyInfo,
-                                   case_type: str,
-                                   retainer_amount: float,
-                                   hourly_rate: float,
-                                   scope_of_representation: List[str]) -> str:
-        """
-        Generate Attorney-Client Engagement Letter / Retainer Agreement
-        """
-        today = datetime.now().strftime("%B %d, %Y")
+STIPULATION_OF_SETTLEMENT_TEMPLATE = CompiledTemplate(
+    "".join(source for _, source in STIPULATION_SECTION_SOURCES))
 
-        scope_text = "\n".join([f"        • {item}" for item in scope_of_representation])
 
-        template = f"""
-{'=' * 75}
-                        {self.firm_name.upper()}
-                        ATTORNEYS AT LAW
-{'=' * 75}
+# Associate, paralegal and law clerk rates as fractions of the partner rate
+RATE_SCHEDULE_TEMPLATE = CompiledTemplate("""\
+   Partners:                    ${hourly_rate:,.2f} per hour
+   Associates:                  ${associate_rate:,.2f} per hour
+   Paralegals:                  ${paralegal_rate:,.2f} per hour
+   Law Clerks:                  ${law_clerk_rate:,.2f} per hour""")
+
 
-{self.firm_address}
-{self.firm_phone}
+@lru_cache(maxsize=32)
+def render_rate_schedule(hourly_rate: float) -> str:
+    """Render the hourly rate table for a given partner rate"""
+    return RATE_SCHEDULE_TEMPLATE.render(
+        hourly_rate=hourly_rate,
+        associate_rate=hourly_rate * 0.75,
+        paralegal_rate=hourly_rate * 0.40,
+        law_clerk_rate=hourly_rate * 0.35)
+
+
+ENGAGEMENT_LETTER_TEMPLATE = CompiledTemplate("""
+{letterhead}
 
 {today}
 
@@ -1333,21 +1414,21 @@ VIA HAND DELIVERY / EMAIL
 
 {client.name}
 {client.address}
-{client.city}, {client.state} {client.zip_code}
+{client.city_line}
 
         RE: Engagement Letter and Retainer Agreement
             Matter: {case_type}
 
-Dear {client.name.split()[0]}:
+Dear {client.first_name}:
 
-Thank you for selecting {self.firm_name} to represent you in connection with
+Thank you for selecting {firm_name} to represent you in connection with
 the above-referenced matter. This letter will confirm the terms of our
 engagement and serves as our written retainer agreement as required by
 22 NYCRR Part 1215.
 
-{'=' * 75}
+{rule}
                     1. SCOPE OF REPRESENTATION
-{'=' * 75}
+{rule}
 
 You have retained this firm to represent you in connection with:
 
@@ -1361,9 +1442,9 @@ This representation does NOT include:
         • Bankruptcy proceedings
         • Any matters not specifically listed above
 
-{'=' * 75}
+{rule}
                     2. LEGAL FEES AND BILLING
-{'=' * 75}
+{rule}
 
 A. RETAINER:
    You agree to pay a retainer in the amount of ${retainer_amount:,.2f}.
@@ -1382,10 +1463,7 @@ A. RETAINER:
 B. HOURLY RATES:
    Our current hourly rates are as follows:
 
-   Partners:                    ${hourly_rate:,.2f} per hour
-   Associates:                  ${hourly_rate * 0.75:,.2f} per hour
-   Paralegals:                  ${hourly_rate * 0.40:,.2f} per hour
-   Law Clerks:                  ${hourly_rate * 0.35:,.2f} per hour
+{rate_schedule}
 
    These rates are subject to change with 30 days' written notice.
 
@@ -1413,9 +1491,9 @@ E. BILLING STATEMENTS:
    30 days of the statement date. Accounts more than 60 days past due
    may accrue interest at the rate of 1% per month.
 
-{'=' * 75}
+{rule}
                     3. CLIENT RESPONSIBILITIES
-{'=' * 75}
+{rule}
 
 To enable us to represent you effectively, you agree to:
 
@@ -1426,9 +1504,9 @@ To enable us to represent you effectively, you agree to:
         • Pay all fees and costs in a timely manner
         • Cooperate fully in the preparation of your case
 
-{'=' * 75}
+{rule}
                     4. COMMUNICATION
-{'=' * 75}
+{rule}
 
 We will keep you informed of significant developments in your case. You
 may contact us by telephone or email during regular business hours.
@@ -1437,9 +1515,9 @@ We will endeavor to return all calls and emails within 24-48 business hours.
 Emergency contact information will be provided for urgent matters that
 arise outside of business hours.
 
-{'=' * 75}
+{rule}
                     5. NO GUARANTEE OF OUTCOME
-{'=' * 75}
+{rule}
 
 While we will use our best efforts to achieve a favorable outcome, we
 cannot and do not guarantee any particular result. The outcome of any
@@ -1447,9 +1525,9 @@ legal matter depends on many factors beyond our control, including the
 facts, the law, the judge assigned to the case, and the actions of
 opposing parties.
 
-{'=' * 75}
+{rule}
                     6. TERMINATION
-{'=' * 75}
+{rule}
 
 Either party may terminate this agreement at any time upon written notice.
 If you terminate our representation, you will remain responsible for all
@@ -1459,17 +1537,17 @@ If we determine that we must withdraw from the representation, we will
 give you reasonable notice and take steps to protect your interests,
 including returning your file and assisting in the transfer to new counsel.
 
-{'=' * 75}
+{rule}
                     7. FILE RETENTION
-{'=' * 75}
+{rule}
 
 Upon conclusion of the matter, your file will be retained for a period
 of seven (7) years, after which it may be destroyed. Original documents
 will be returned to you upon request.
 
-{'=' * 75}
+{rule}
                     8. ACKNOWLEDGMENT
-{'=' * 75}
+{rule}
 
 By signing below, you acknowledge that:
 
@@ -1487,16 +1565,16 @@ achieve the best possible outcome in your case.
 
 Very truly yours,
 
-{self.firm_name}
+{firm_name}
 
 
 _________________________________
 Attorney Name, Esq.
 
 
-{'=' * 75}
+{rule}
                     ACKNOWLEDGMENT AND AGREEMENT
-{'=' * 75}
+{rule}
 
 I, {client.name}, have read and understand this Engagement Letter and
 Retainer Agreement. I agree to the terms set forth herein and acknowledge
@@ -1511,7 +1589,7 @@ Retainer Amount Enclosed: $_______________
 
 Check Number: _______________
 
-{'=' * 75}
+{rule}
 
                     22 NYCRR PART 1215 NOTICE
 
@@ -1519,52 +1597,33 @@ Check Number: _______________
         written letter of engagement pursuant to the rules
         of the Appellate Division of the Supreme Court.
 
-{'=' * 75}
-"""
-        return template
-
-    def generate_initial_client_letter(self,
-                                       client: PartyInfo,
-                                       case_type: str,
-                                       next_steps: List[str],
-                                       documents_needed: List[str]) -> str:
-        """
-        Generate Initial Client Letter / Welcome Letter
-        """
-        today = datetime.now().strftime("%B %d, %Y")
-
-        next_steps_text = "\n".join([f"        {i+1}. {step}" for i, step in enumerate(next_steps)])
-        docs_text = "\n".join([f"        □ {doc}" for doc in documents_needed])
+{rule}
+""")
 
-        template = f"""
-{'=' * 75}
-                        {self.firm_name.upper()}
-                        ATTORNEYS AT LAW
-{'=' * 75}
 
-{self.firm_address}
-{self.firm_phone}
+INITIAL_CLIENT_LETTER_TEMPLATE = CompiledTemplate("""
+{letterhead}
 
 {today}
 
 {client.name}
 {client.address}
-{client.city}, {client.state} {client.zip_code}
+{client.city_line}
 
         RE: {case_type}
             Our File No.: _______________
 
-Dear {client.name.split()[0]}:
+Dear {client.first_name}:
 
-Welcome to {self.firm_name}. We are pleased to have you as a client and
+Welcome to {firm_name}. We are pleased to have you as a client and
 are committed to providing you with excellent legal representation.
 
 This letter provides important information about your case and outlines
 the next steps in the process.
 
-{'=' * 75}
+{rule}
                     YOUR LEGAL TEAM
-{'=' * 75}
+{rule}
 
 Your matter has been assigned to:
 
@@ -1575,26 +1634,26 @@ Your matter has been assigned to:
 
 Please feel free to contact us with any questions or concerns.
 
-{'=' * 75}
+{rule}
                     CASE OVERVIEW
-{'=' * 75}
+{rule}
 
 Matter Type:            {case_type}
 Date Opened:            {today}
 Court:                  To be determined
 Index/Docket Number:    To be assigned upon filing
 
-{'=' * 75}
+{rule}
                     NEXT STEPS
-{'=' * 75}
+{rule}
 
 The following steps will be taken in your matter:
 
 {next_steps_text}
 
-{'=' * 75}
+{rule}
                     DOCUMENTS NEEDED
-{'=' * 75}
+{rule}
 
 To proceed effectively with your case, we will need the following
 documents. Please provide these at your earliest convenience:
@@ -1604,9 +1663,9 @@ documents. Please provide these at your earliest convenience:
 Please bring original documents if available; we will make copies and
 return the originals to you.
 
-{'=' * 75}
+{rule}
                     IMPORTANT REMINDERS
-{'=' * 75}
+{rule}
 
 1. COMMUNICATION:
    • Notify us immediately of any changes to your address, phone number,
@@ -1633,9 +1692,9 @@ return the originals to you.
    • Do not interfere with the other parent's time with the children
    • Document any concerns about the children's welfare
 
-{'=' * 75}
+{rule}
                     WHAT TO EXPECT
-{'=' * 75}
+{rule}
 
 Depending on the complexity of your case, the process typically takes:
 
@@ -1650,9 +1709,9 @@ These are estimates only. Every case is unique, and actual timeframes
 may vary based on court schedules, the cooperation of the parties, and
 other factors.
 
-{'=' * 75}
+{rule}
                     OUR COMMITMENT TO YOU
-{'=' * 75}
+{rule}
 
 We understand that this is a difficult time for you and your family.
 Our firm is committed to:
@@ -1663,14 +1722,14 @@ Our firm is committed to:
         • Advocating zealously on your behalf
         • Working toward the best possible outcome
 
-{'=' * 75}
+{rule}
 
 If you have any questions about this letter or your case, please do not
 hesitate to contact us. We look forward to working with you.
 
 Very truly yours,
 
-{self.firm_name}
+{firm_name}
 
 
 _________________________________
@@ -1683,31 +1742,12 @@ Enclosures:
         □ Authorization for Release of Information
         □ Fee Schedule
 
-{'=' * 75}
-"""
-        return template
-
-    def generate_demand_letter(self,
-                               client: PartyInfo,
-                               opposing_party: PartyInfo,
-                               case_type: str,
-                               demands: List[str],
-                               deadline_days: int = 20) -> str:
-        """
-        Generate Initial Demand Letter to Opposing Party
-        """
-        today = datetime.now().strftime("%B %d, %Y")
+{rule}
+""")
 
-        demands_text = "\n".join([f"        {i+1}. {demand}" for i, demand in enumerate(demands)])
 
-        template = f"""
-{'=' * 75}
-                        {self.firm_name.upper()}
-                        ATTORNEYS AT LAW
-{'=' * 75}
-
-{self.firm_address}
-{self.firm_phone}
+DEMAND_LETTER_TEMPLATE = CompiledTemplate("""
+{letterhead}
 
 {today}
 
@@ -1715,35 +1755,35 @@ VIA CERTIFIED MAIL, RETURN RECEIPT REQUESTED
 
 {opposing_party.name}
 {opposing_party.address}
-{opposing_party.city}, {opposing_party.state} {opposing_party.zip_code}
+{opposing_party.city_line}
 
         RE: {case_type}
             Our Client: {client.name}
 
-Dear {opposing_party.name.split()[-1]}:
+Dear {opposing_party.last_name}:
 
 Please be advised that this firm represents {client.name} in connection
 with the above-referenced matter. All future communications regarding
 this matter should be directed to this office. Please do not contact
 our client directly.
 
-{'=' * 75}
+{rule}
                     STATEMENT OF FACTS
-{'=' * 75}
+{rule}
 
 [Insert relevant facts of the case]
 
-{'=' * 75}
+{rule}
                     DEMANDS
-{'=' * 75}
+{rule}
 
 On behalf of our client, we hereby demand the following:
 
 {demands_text}
 
-{'=' * 75}
+{rule}
                     RESPONSE REQUIRED
-{'=' * 75}
+{rule}
 
 Please respond to this letter within {deadline_days} days of receipt.
 If we do not receive a satisfactory response by that time, we are
@@ -1754,9 +1794,9 @@ amicably and without the expense and uncertainty of litigation. To that
 end, we invite you or your attorney to contact us to discuss settlement
 options.
 
-{'=' * 75}
+{rule}
                     PRESERVATION OF EVIDENCE
-{'=' * 75}
+{rule}
 
 You are hereby placed on notice to preserve all documents, records,
 communications, and other evidence related to this matter. This includes,
@@ -1771,16 +1811,16 @@ but is not limited to:
 Destruction or spoliation of evidence may result in sanctions and
 adverse inferences in any legal proceedings.
 
-{'=' * 75}
+{rule}
                     STATUTE OF LIMITATIONS
-{'=' * 75}
+{rule}
 
 Please be advised that various statutes of limitations may apply to
 claims arising from this matter. This letter is not intended to waive
 or extend any applicable limitation periods. All rights are expressly
 reserved.
 
-{'=' * 75}
+{rule}
 
 This letter is written in an effort to resolve this dispute without
 litigation. It is not intended to be a complete recitation of all facts,
@@ -1790,7 +1830,7 @@ We look forward to your prompt response.
 
 Very truly yours,
 
-{self.firm_name}
+{firm_name}
 
 
 _________________________________
@@ -1798,31 +1838,12 @@ Attorney Name, Esq.
 
 cc: {client.name} (via email)
 
-{'=' * 75}
-"""
-        return template
-
-    def generate_opposing_counsel_letter(self,
-                                         client: PartyInfo,
-                                         opposing_party: PartyInfo,
-                                         opposing_attorney: str,
-                                         opposing_firm: str,
-                                         opposing_address: str,
-                                         case_type: str,
-                                         index_number: str = "") -> str:
-        """
-        Generate Letter to Opposing Counsel
-        """
-        today = datetime.now().strftime("%B %d, %Y")
+{rule}
+""")
 
-        template = f"""
-{'=' * 75}
-                        {self.firm_name.upper()}
-                        ATTORNEYS AT LAW
-{'=' * 75}
 
-{self.firm_address}
-{self.firm_phone}
+OPPOSING_COUNSEL_LETTER_TEMPLATE = CompiledTemplate("""
+{letterhead}
 
 {today}
 
@@ -1833,7 +1854,7 @@ VIA EMAIL AND FIRST CLASS MAIL
 {opposing_address}
 
         RE: {client.name} v. {opposing_party.name}
-            Index No.: {index_number if index_number else "Not Yet Assigned"}
+            Index No.: {index_number}
 
 Dear Counselor:
 
@@ -1844,9 +1865,9 @@ Kindly direct all future communications regarding this case to my
 attention. Please confirm your representation of {opposing_party.name}
 at your earliest convenience.
 
-{'=' * 75}
+{rule}
                     PRELIMINARY CONFERENCE
-{'=' * 75}
+{rule}
 
 [ ] We have not yet filed the action. We would like to explore the
     possibility of settlement before commencing litigation.
@@ -1857,9 +1878,9 @@ at your earliest convenience.
 [ ] The Preliminary Conference is yet to be scheduled. We will
     notify you once we receive a date from the court.
 
-{'=' * 75}
+{rule}
                     DISCOVERY
-{'=' * 75}
+{rule}
 
 [ ] Enclosed please find our client's Statement of Net Worth and
     supporting documentation. Please provide your client's Net Worth
@@ -1871,9 +1892,9 @@ at your earliest convenience.
 [ ] We are preparing discovery demands and will forward them to you
     shortly.
 
-{'=' * 75}
+{rule}
                     TEMPORARY RELIEF
-{'=' * 75}
+{rule}
 
 [ ] Our client intends to file a motion for pendente lite relief,
     including [child support / maintenance / counsel fees / exclusive
@@ -1883,9 +1904,9 @@ at your earliest convenience.
 [ ] We are open to discussing temporary arrangements to maintain the
     status quo during the pendency of this action.
 
-{'=' * 75}
+{rule}
                     SETTLEMENT
-{'=' * 75}
+{rule}
 
 [ ] Our client is interested in exploring settlement. Please let us
     know if your client is amenable to a four-way conference.
@@ -1896,14 +1917,14 @@ at your earliest convenience.
 [ ] Our client is prepared to proceed to trial if a fair settlement
     cannot be reached.
 
-{'=' * 75}
+{rule}
 
 Please contact me at your earliest convenience to discuss how we can
 move this matter forward efficiently.
 
 Very truly yours,
 
-{self.firm_name}
+{firm_name}
 
 
 _________________________________
@@ -1915,26 +1936,12 @@ Enclosures: [ ] Statement of Net Worth
             [ ] Supporting Documentation
             [ ] ______________
 
-{'=' * 75}
-"""
-        return template
+{rule}
+""")
 
-    def generate_notice_of_appearance(self,
-                                      client: PartyInfo,
-                                      opposing_party: PartyInfo,
-                                      county: str,
-                                      index_number: str,
-                                      attorney_name: str) -> str:
-        """
-        Generate Notice of Appearance
-        """
-        today = datetime.now().strftime("%B %d, %Y")
 
-        template = f"""
-{'=' * 75}
-                    SUPREME COURT OF THE STATE OF NEW YORK
-                           COUNTY OF {county.upper()}
-{'=' * 75}
+NOTICE_OF_APPEARANCE_TEMPLATE = CompiledTemplate("""
+{supreme_court_header}
 
 {client.name},
                                                     Plaintiff,
@@ -1942,11 +1949,11 @@ Enclosures: [ ] Statement of Net Worth
 
 {opposing_party.name},
                                                     Defendant.
-{'=' * 75}
+{rule}
 
                          NOTICE OF APPEARANCE
 
-{'=' * 75}
+{rule}
 
 PLEASE TAKE NOTICE that the undersigned attorney hereby appears on
 behalf of the [Plaintiff / Defendant], {client.name}, in the
@@ -1958,15 +1965,15 @@ undersigned at the address set forth below.
 
 Dated: {today}
 
-                                        {self.firm_name}
+                                        {firm_name}
                                         Attorneys for [Plaintiff/Defendant]
 
 
                                         By: _________________________
                                             {attorney_name}, Esq.
 
-                                        {self.firm_address}
-                                        {self.firm_phone}
+                                        {firm_address}
+                                        {firm_phone}
 
 
 TO:     [Opposing Counsel Name], Esq.
@@ -1974,27 +1981,12 @@ TO:     [Opposing Counsel Name], Esq.
         [Opposing Firm Address]
         Attorneys for [Plaintiff/Defendant]
 
-{'=' * 75}
-"""
-        return template
-
-    def generate_summons_with_notice(self,
-                                    plaintiff: PartyInfo,
-                                    defendant: PartyInfo,
-                                    county: str,
-                                    relief_requested: List[str]) -> str:
-        """
-        Generate Summons with Notice for Divorce
-        """
-        today = datetime.now().strftime("%B %d, %Y")
+{rule}
+""")
 
-        relief_text = "\n".join([f"        [ ] {relief}" for relief in relief_requested])
 
-        template = f"""
-{'=' * 75}
-                    SUPREME COURT OF THE STATE OF NEW YORK
-                           COUNTY OF {county.upper()}
-{'=' * 75}
+SUMMONS_WITH_NOTICE_TEMPLATE = CompiledTemplate("""
+{supreme_court_header}
 
 {plaintiff.name},
                                                     Plaintiff,
@@ -2002,11 +1994,11 @@ TO:     [Opposing Counsel Name], Esq.
 
 {defendant.name},
                                                     Defendant.
-{'=' * 75}
+{rule}
 
                          SUMMONS WITH NOTICE
 
-{'=' * 75}
+{rule}
 
 ACTION FOR DIVORCE
 
@@ -2022,18 +2014,12 @@ the relief demanded in the notice set forth below.
 
 Dated: {today}
 
-                                        {self.firm_name}
-                                        Attorneys for Plaintiff
-
-                                        By: _________________________
-
-                                        {self.firm_address}
-                                        {self.firm_phone}
+{signature_block}
 
 
-{'=' * 75}
+{rule}
                               NOTICE
-{'=' * 75}
+{rule}
 
 The nature of this action is to dissolve the marriage between the
 parties on the grounds of:
@@ -2068,10 +2054,10 @@ The relief sought is:
             and proper
 
 
-{'=' * 75}
+{rule}
                     NOTICE OF AUTOMATIC ORDERS
                       (DRL §236(B)(2)(b))
-{'=' * 75}
+{rule}
 
 PURSUANT TO DOMESTIC RELATIONS LAW §236(B)(2)(b), UPON SERVICE OF
 THIS SUMMONS, THE FOLLOWING AUTOMATIC ORDERS SHALL BE IN EFFECT
@@ -2116,19 +2102,19 @@ ACTION IS DISMISSED:
     insurance, automobile insurance, homeowner's and renter's insurance
     policies in full force and effect.
 
-{'=' * 75}
+{rule}
                     NOTICE OF GUIDELINE MAINTENANCE
                         (DRL §236(B)(6))
-{'=' * 75}
+{rule}
 
 The maintenance guideline obligation is computed pursuant to a formula
 set forth in Domestic Relations Law §236(B)(6). For more information,
 visit: www.nycourts.gov/divorce
 
-{'=' * 75}
+{rule}
                     NOTICE CONCERNING CONTINUATION
                     OF HEALTH CARE COVERAGE
-{'=' * 75}
+{rule}
 
 Pursuant to DRL §255, please take notice that upon the entry of a
 judgment of divorce, the non-titled spouse may no longer be allowed to
@@ -2136,25 +2122,735 @@ receive health coverage under the titled spouse's employer-provided
 group insurance. The non-titled spouse may be entitled to purchase
 COBRA continuation coverage at the group rate for a limited period.
 
-{'=' * 75}
+{rule}
 
-                                        {self.firm_name}
+                                        {firm_name}
                                         Attorneys for Plaintiff
 
-                                        {self.firm_address}
-                                        {self.firm_phone}
+                                        {firm_address}
+                                        {firm_phone}
 
-{'=' * 75}
-"""
-        return template
+{rule}
+""")
+
+
+class DocumentTemplates:
+    """Generate NY Family Law document templates
+
+    Instances hold only the firm details and are treated as immutable, so a
+    single instance per firm is shared (see create_document_templates).
+    """
+
+    __slots__ = ('firm_name', 'firm_address', 'firm_phone', 'letterhead', 'firm_contact',
+                 'prepared_by', 'signature_block')
+
+    def __init__(self, firm_name: str = "The White Law Group",
+                 firm_address: str = "4 Brower Ave Suite 3, Woodmere, NY 11598",
+                 firm_phone: str = "(347) 628-5440"):
+        self.firm_name = firm_name
+        self.firm_address = firm_address
+        self.firm_phone = firm_phone
+        self.letterhead = LETTERHEAD_TEMPLATE.render(
+            firm_name_upper=firm_name.upper(), firm_address=firm_address,
+            firm_phone=firm_phone)
+        self.firm_contact = FIRM_CONTACT_TEMPLATE.render(
+            firm_name=firm_name, firm_address=firm_address, firm_phone=firm_phone)
+        self.prepared_by = f"PREPARED BY:\n{self.firm_contact}"
+        self.signature_block = SIGNATURE_BLOCK_TEMPLATE.render(
+            firm_name=firm_name, firm_address=firm_address, firm_phone=firm_phone)
+
+    def _net_worth_statement_fields(self,
+                                    party: PartyInfo,
+                                    spouse: PartyInfo,
+                                    county: str,
+                                    index_number: str,
+                                    income_data: Dict,
+                                    assets: Dict,
+                                    liabilities: Dict,
+                                    expenses: Dict) -> Dict:
+        """Fields for the Net Worth Statement template"""
+        return dict(
+            county_upper=county.upper(),
+            party=party, spouse=spouse, index_number=index_number,
+            deponent_block=render_party_block(party, 'deponent'),
+            spouse_block=render_party_block(spouse, 'spouse'),
+            firm_contact=self.firm_contact)
+
+    def generate_net_worth_statement(self,
+                                     party: PartyInfo,
+                                     spouse: PartyInfo,
+                                     county: str,
+                                     index_number: str,
+                                     income_data: Dict,
+                                     assets: Dict,
+                                     liabilities: Dict,
+                                     expenses: Dict) -> str:
+        """
+        Generate Net Worth Statement per DRL 236 and 22 NYCRR 202.16(b)
+        """
+        fields = self._net_worth_statement_fields(party, spouse, county, index_number, income_data,
+                                                  assets, liabilities, expenses)
+        return NET_WORTH_STATEMENT_TEMPLATE.render(**fields)
+
+    def write_net_worth_statement(self,
+                                  fp: IO[str],
+                                  party: PartyInfo,
+                                  spouse: PartyInfo,
+                                  county: str,
+                                  index_number: str,
+                                  income_data: Dict,
+                                  assets: Dict,
+                                  liabilities: Dict,
+                                  expenses: Dict) -> None:
+        """Stream the Net Worth Statement to a text file object"""
+        fields = self._net_worth_statement_fields(party, spouse, county, index_number, income_data,
+                                                  assets, liabilities, expenses)
+        NET_WORTH_STATEMENT_TEMPLATE.write(fp, **fields)
+
+    def _verified_complaint_fields(self,
+                                   plaintiff: PartyInfo,
+                                   defendant: PartyInfo,
+                                   county: str,
+                                   marriage_date: str,
+                                   marriage_place: str,
+                                   separation_date: str,
+                                   children: List[ChildInfo],
+                                   grounds: str = "Irretrievable Breakdown") -> Dict:
+        """Fields for the Verified Complaint template"""
+        return dict(
+            county_upper=county.upper(),
+            plaintiff=plaintiff, defendant=defendant,
+            marriage_date=marriage_date, marriage_place=marriage_place,
+            children_section=render_complaint_children(tuple(children)),
+            firm_name=self.firm_name, signature_block=self.signature_block)
+
+    def generate_verified_complaint(self,
+                                    plaintiff: PartyInfo,
+                                    defendant: PartyInfo,
+                                    county: str,
+                                    marriage_date: str,
+                                    marriage_place: str,
+                                    separation_date: str,
+                                    children: List[ChildInfo],
+                                    grounds: str = "Irretrievable Breakdown") -> str:
+        """
+        Generate Verified Complaint for Divorce (Form UD-2)
+        """
+        fields = self._verified_complaint_fields(plaintiff, defendant, county, marriage_date,
+                                                 marriage_place, separation_date, children,
+                                                 grounds)
+        return VERIFIED_COMPLAINT_TEMPLATE.render(**fields)
+
+    def write_verified_complaint(self,
+                                 fp: IO[str],
+                                 plaintiff: PartyInfo,
+                                 defendant: PartyInfo,
+                                 county: str,
+                                 marriage_date: str,
+                                 marriage_place: str,
+                                 separation_date: str,
+                                 children: List[ChildInfo],
+                                 grounds: str = "Irretrievable Breakdown") -> None:
+        """Stream the Verified Complaint to a text file object"""
+        fields = self._verified_complaint_fields(plaintiff, defendant, county, marriage_date,
+                                                 marriage_place, separation_date, children,
+                                                 grounds)
+        VERIFIED_COMPLAINT_TEMPLATE.write(fp, **fields)
+
+    def _child_support_worksheet_fields(self,
+                                        custodial_parent: PartyInfo,
+                                        non_custodial_parent: PartyInfo,
+                                        county: str,
+                                        children: List[ChildInfo],
+                                        custodial_income: float,
+                                        non_custodial_income: float,
+                                        childcare_cost: float = 0,
+                                        health_insurance: float = 0,
+                                        education_cost: float = 0) -> Dict:
+        """Fields for the CSSA worksheet template"""
+        num_children = len(children)
+
+        cssa_pct = CSSA_RATES.get(num_children, CSSA_DEFAULT_RATE)
+
+        combined_income = custodial_income + non_custodial_income
+
+        # Calculate shares
+        if combined_income > 0:
+            custodial_share = custodial_income / combined_income
+            non_custodial_share = non_custodial_income / combined_income
+        else:
+            custodial_share = 0.5
+            non_custodial_share = 0.5
+
+        # Basic support calculation
+        income_for_calc = min(combined_income, CSSA_INCOME_CAP)
+        basic_support = income_for_calc * cssa_pct
+        ncp_basic_support = basic_support * non_custodial_share
+
+        # Add-ons (pro rata share)
+        total_addons = childcare_cost + health_insurance + education_cost
+        ncp_addons = total_addons * non_custodial_share
+
+        total_support = ncp_basic_support + ncp_addons
+        non_custodial_percent = non_custodial_share * 100
+
+        children_list = "\n".join(
+            f"    {i}. {c.name}, DOB: {c.dob}, Age: {c.age}"
+            for i, c in enumerate(children, 1)
+        )
+
+        return dict(
+            county=county,
+            custodial_parent=custodial_parent,
+            non_custodial_parent=non_custodial_parent,
+            children_list=children_list, num_children=num_children,
+            custodial_income=custodial_income,
+            non_custodial_income=non_custodial_income,
+            combined_income=combined_income, cssa_cap=CSSA_INCOME_CAP,
+            income_for_calc=income_for_calc, cssa_percent=cssa_pct * 100,
+            basic_support=basic_support,
+            custodial_percent=custodial_share * 100,
+            non_custodial_percent=non_custodial_percent,
+            ncp_share_label=f"{non_custodial_percent:.1f}%",
+            ncp_basic_support=ncp_basic_support,
+            childcare_cost=childcare_cost,
+            ncp_childcare=childcare_cost * non_custodial_share,
+            health_insurance=health_insurance,
+            ncp_health_insurance=health_insurance * non_custodial_share,
+            education_cost=education_cost,
+            ncp_education=education_cost * non_custodial_share,
+            total_addons=total_addons, ncp_addons=ncp_addons,
+            total_support=total_support,
+            monthly_payment=total_support / 12,
+            biweekly_payment=total_support / 26,
+            weekly_payment=total_support / 52,
+            above_cap_income=max(0, combined_income - CSSA_INCOME_CAP),
+            prepared_by=self.prepared_by)
+
+    def generate_child_support_worksheet(self,
+                                         custodial_parent: PartyInfo,
+                                         non_custodial_parent: PartyInfo,
+                                         county: str,
+                                         children: List[ChildInfo],
+                                         custodial_income: float,
+                                         non_custodial_income: float,
+                                         childcare_cost: float = 0,
+                                         health_insurance: float = 0,
+                                         education_cost: float = 0) -> str:
+        """
+        Generate Child Support Standards Act (CSSA) Worksheet
+        """
+        fields = self._child_support_worksheet_fields(custodial_parent, non_custodial_parent,
+                                                      county, children, custodial_income,
+                                                      non_custodial_income, childcare_cost,
+                                                      health_insurance, education_cost)
+        return CHILD_SUPPORT_WORKSHEET_TEMPLATE.render(**fields)
+
+    def write_child_support_worksheet(self,
+                                      fp: IO[str],
+                                      custodial_parent: PartyInfo,
+                                      non_custodial_parent: PartyInfo,
+                                      county: str,
+                                      children: List[ChildInfo],
+                                      custodial_income: float,
+                                      non_custodial_income: float,
+                                      childcare_cost: float = 0,
+                                      health_insurance: float = 0,
+                                      education_cost: float = 0) -> None:
+        """Stream the CSSA worksheet to a text file object"""
+        fields = self._child_support_worksheet_fields(custodial_parent, non_custodial_parent,
+                                                      county, children, custodial_income,
+                                                      non_custodial_income, childcare_cost,
+                                                      health_insurance, education_cost)
+        CHILD_SUPPORT_WORKSHEET_TEMPLATE.write(fp, **fields)
+
+    def _family_offense_petition_fields(self,
+                                        petitioner: PartyInfo,
+                                        respondent: PartyInfo,
+                                        county: str,
+                                        relationship: str,
+                                        incidents: List[Dict],
+                                        relief_requested: List[str]) -> Dict:
+        """Fields for the Family Offense Petition template"""
+        incident_parts = []
+        append = incident_parts.append
+        for i, incident in enumerate(incidents, 1):
+            get = incident.get
+            append(FAMILY_OFFENSE_INCIDENT_TEMPLATE.render(
+                number=i,
+                date=get('date', '_______________'),
+                time=get('time', '_______________'),
+                location=get('location', '_______________'),
+                description=get('description', '_' * 60),
+                injuries=get('injuries') or 'None',
+                witnesses=get('witnesses') or 'None',
+                police_report=get('police_report', '_______________')))
+        incidents_text = "".join(incident_parts)
+
+        relief_text = "\n".join(f"    [X] {r}" for r in relief_requested)
+
+        return dict(
+            county_upper=county.upper(),
+            petitioner=petitioner, respondent=respondent,
+            petitioner_block=render_party_block(petitioner, 'petition'),
+            respondent_block=render_party_block(respondent, 'petition'),
+            relationship=relationship, incidents_text=incidents_text,
+            relief_text=relief_text,
+            prepared_by=self.prepared_by)
+
+    def generate_family_offense_petition(self,
+                                         petitioner: PartyInfo,
+                                         respondent: PartyInfo,
+                                         county: str,
+                                         relationship: str,
+                                         incidents: List[Dict],
+                                         relief_requested: List[str]) -> str:
+        """
+        Generate Family Offense Petition for Order of Protection
+        """
+        fields = self._family_offense_petition_fields(petitioner, respondent, county, relationship,
+                                                      incidents, relief_requested)
+        return FAMILY_OFFENSE_PETITION_TEMPLATE.render(**fields)
+
+    def write_family_offense_petition(self,
+                                      fp: IO[str],
+                                      petitioner: PartyInfo,
+                                      respondent: PartyInfo,
+                                      county: str,
+                                      relationship: str,
+                                      incidents: List[Dict],
+                                      relief_requested: List[str]) -> None:
+        """Stream the Family Offense Petition to a text file object"""
+        fields = self._family_offense_petition_fields(petitioner, respondent, county, relationship,
+                                                      incidents, relief_requested)
+        FAMILY_OFFENSE_PETITION_TEMPLATE.write(fp, **fields)
+
+    def _stipulation_of_settlement_fields(self,
+                                          plaintiff: PartyInfo,
+                                          defendant: PartyInfo,
+                                          county: str,
+                                          index_number: str,
+                                          marriage_date: str,
+                                          children: List[ChildInfo],
+                                          custody_arrangement: str,
+                                          child_support_monthly: float,
+                                          maintenance_monthly: float,
+                                          maintenance_duration: str,
+                                          property_division: Dict, *,
+                                          sections: Optional[Collection[str]] = None) -> Dict:
+        """Fields for the Stipulation of Settlement template"""
+        county_upper = county.upper()
+
+        if sections is not None and 'children' not in sections:
+            children_section = ""
+        elif children:
+            children_section = STIPULATION_CHILDREN_TEMPLATE.render(
+                child_lines="".join(f"    {child.name}, born {child.dob}\n" for child in children),
+                custody_arrangement=custody_arrangement)
+        else:
+            children_section = STIPULATION_NO_CHILDREN_ARTICLE
+
+        return dict(
+            county_upper=county_upper,
+            plaintiff=plaintiff, defendant=defendant,
+            index_number=index_number, marriage_date=marriage_date,
+            children_section=children_section,
+            child_support_monthly=child_support_monthly,
+            maintenance_monthly=maintenance_monthly,
+            maintenance_duration=maintenance_duration,
+            prepared_by=self.prepared_by)
+
+    def generate_stipulation_of_settlement(self,
+                                           plaintiff: PartyInfo,
+                                           defendant: PartyInfo,
+                                           county: str,
+                                           index_number: str,
+                                           marriage_date: str,
+                                           children: List[ChildInfo],
+                                           custody_arrangement: str,
+                                           child_support_monthly: float,
+                                           maintenance_monthly: float,
+                                           maintenance_duration: str,
+                                           property_division: Dict, *,
+                                           sections: Optional[Collection[str]] = None) -> str:
+        """
+        Generate Stipulation of Settlement for divorce
+
+        Pass sections= (names from STIPULATION_SECTIONS) to render only those
+        parts of the agreement, e.g. for a preview of the support articles.
+        """
+        fields = self._stipulation_of_settlement_fields(plaintiff, defendant, county, index_number,
+                                                        marriage_date, children,
+                                                        custody_arrangement, child_support_monthly,
+                                                        maintenance_monthly, maintenance_duration,
+                                                        property_division, sections=sections)
+        if sections is not None:
+            return render_sections(STIPULATION_SECTIONS, sections, fields)
+        return STIPULATION_OF_SETTLEMENT_TEMPLATE.render(**fields)
+
+    def write_stipulation_of_settlement(self,
+                                        fp: IO[str],
+                                        plaintiff: PartyInfo,
+                                        defendant: PartyInfo,
+                                        county: str,
+                                        index_number: str,
+                                        marriage_date: str,
+                                        children: List[ChildInfo],
+                                        custody_arrangement: str,
+                                        child_support_monthly: float,
+                                        maintenance_monthly: float,
+                                        maintenance_duration: str,
+                                        property_division: Dict, *,
+                                        sections: Optional[Collection[str]] = None) -> None:
+        """Stream the Stipulation of Settlement to a text file object"""
+        fields = self._stipulation_of_settlement_fields(plaintiff, defendant, county, index_number,
+                                                        marriage_date, children,
+                                                        custody_arrangement, child_support_monthly,
+                                                        maintenance_monthly, maintenance_duration,
+                                                        property_division, sections=sections)
+        if sections is not None:
+            fp.write(render_sections(STIPULATION_SECTIONS, sections, fields))
+        else:
+            STIPULATION_OF_SETTLEMENT_TEMPLATE.write(fp, **fields)
+
+    def _engagement_letter_fields(self,
+                                  client: PartyInfo,
+                                  case_type: str,
+                                  retainer_amount: float,
+                                  hourly_rate: float,
+                                  scope_of_representation: List[str],
+                                  as_of: Optional[date] = None) -> Dict:
+        """Fields for the Engagement Letter template"""
+        today = today_string(as_of)
+
+        scope_text = marked_lines(BULLET, scope_of_representation)
+
+        return dict(
+            today=today, client=client,
+            case_type=case_type, scope_text=scope_text,
+            retainer_amount=retainer_amount,
+            rate_schedule=render_rate_schedule(hourly_rate),
+            firm_name=self.firm_name, letterhead=self.letterhead)
+
+    def generate_engagement_letter(self,
+                                   client: PartyInfo,
+                                   case_type: str,
+                                   retainer_amount: float,
+                                   hourly_rate: float,
+                                   scope_of_representation: List[str],
+                                   as_of: Optional[date] = None) -> str:
+        """
+        Generate Attorney-Client Engagement Letter / Retainer Agreement
+        """
+        fields = self._engagement_letter_fields(client, case_type, retainer_amount, hourly_rate,
+                                                scope_of_representation, as_of)
+        return ENGAGEMENT_LETTER_TEMPLATE.render(**fields)
+
+    def write_engagement_letter(self,
+                                fp: IO[str],
+                                client: PartyInfo,
+                                case_type: str,
+                                retainer_amount: float,
+                                hourly_rate: float,
+                                scope_of_representation: List[str],
+                                as_of: Optional[date] = None) -> None:
+        """Stream the Engagement Letter to a text file object"""
+        fields = self._engagement_letter_fields(client, case_type, retainer_amount, hourly_rate,
+                                                scope_of_representation, as_of)
+        ENGAGEMENT_LETTER_TEMPLATE.write(fp, **fields)
+
+    def _initial_client_letter_fields(self,
+                                      client: PartyInfo,
+                                      case_type: str,
+                                      next_steps: List[str],
+                                      documents_needed: List[str],
+                                      as_of: Optional[date] = None) -> Dict:
+        """Fields for the Initial Client Letter template"""
+        today = today_string(as_of)
+
+        next_steps_text = numbered_lines(next_steps)
+        docs_text = marked_lines(DOCUMENT_CHECKBOX, documents_needed)
+
+        return dict(
+            today=today, client=client,
+            case_type=case_type, next_steps_text=next_steps_text,
+            docs_text=docs_text,
+            firm_name=self.firm_name, letterhead=self.letterhead)
+
+    def generate_initial_client_letter(self,
+                                       client: PartyInfo,
+                                       case_type: str,
+                                       next_steps: List[str],
+                                       documents_needed: List[str],
+                                       as_of: Optional[date] = None) -> str:
+        """
+        Generate Initial Client Letter / Welcome Letter
+        """
+        fields = self._initial_client_letter_fields(client, case_type, next_steps,
+                                                    documents_needed, as_of)
+        return INITIAL_CLIENT_LETTER_TEMPLATE.render(**fields)
+
+    def write_initial_client_letter(self,
+                                    fp: IO[str],
+                                    client: PartyInfo,
+                                    case_type: str,
+                                    next_steps: List[str],
+                                    documents_needed: List[str],
+                                    as_of: Optional[date] = None) -> None:
+        """Stream the Initial Client Letter to a text file object"""
+        fields = self._initial_client_letter_fields(client, case_type, next_steps,
+                                                    documents_needed, as_of)
+        INITIAL_CLIENT_LETTER_TEMPLATE.write(fp, **fields)
+
+    def _demand_letter_fields(self,
+                              client: PartyInfo,
+                              opposing_party: PartyInfo,
+                              case_type: str,
+                              demands: List[str],
+                              deadline_days: int = 20,
+                              as_of: Optional[date] = None) -> Dict:
+        """Fields for the Demand Letter template"""
+        today = today_string(as_of)
+
+        demands_text = numbered_lines(demands)
+
+        return dict(
+            today=today, client=client, opposing_party=opposing_party,
+            case_type=case_type, demands_text=demands_text,
+            deadline_days=deadline_days,
+            firm_name=self.firm_name, letterhead=self.letterhead)
+
+    def generate_demand_letter(self,
+                               client: PartyInfo,
+                               opposing_party: PartyInfo,
+                               case_type: str,
+                               demands: List[str],
+                               deadline_days: int = 20,
+                               as_of: Optional[date] = None) -> str:
+        """
+        Generate Initial Demand Letter to Opposing Party
+        """
+        fields = self._demand_letter_fields(client, opposing_party, case_type, demands,
+                                            deadline_days, as_of)
+        return DEMAND_LETTER_TEMPLATE.render(**fields)
+
+    def write_demand_letter(self,
+                            fp: IO[str],
+                            client: PartyInfo,
+                            opposing_party: PartyInfo,
+                            case_type: str,
+                            demands: List[str],
+                            deadline_days: int = 20,
+                            as_of: Optional[date] = None) -> None:
+        """Stream the Demand Letter to a text file object"""
+        fields = self._demand_letter_fields(client, opposing_party, case_type, demands,
+                                            deadline_days, as_of)
+        DEMAND_LETTER_TEMPLATE.write(fp, **fields)
+
+    def _opposing_counsel_letter_fields(self,
+                                        client: PartyInfo,
+                                        opposing_party: PartyInfo,
+                                        opposing_attorney: str,
+                                        opposing_firm: str,
+                                        opposing_address: str,
+                                        case_type: str,
+                                        index_number: str = "",
+                                        as_of: Optional[date] = None) -> Dict:
+        """Fields for the Opposing Counsel Letter template"""
+        today = today_string(as_of)
+
+        return dict(
+            letterhead=self.letterhead, today=today,
+            opposing_attorney=opposing_attorney, opposing_firm=opposing_firm,
+            opposing_address=opposing_address,
+            client=client, opposing_party=opposing_party,
+            index_number=index_number or "Not Yet Assigned",
+            firm_name=self.firm_name)
+
+    def generate_opposing_counsel_letter(self,
+                                         client: PartyInfo,
+                                         opposing_party: PartyInfo,
+                                         opposing_attorney: str,
+                                         opposing_firm: str,
+                                         opposing_address: str,
+                                         case_type: str,
+                                         index_number: str = "",
+                                         as_of: Optional[date] = None) -> str:
+        """
+        Generate Letter to Opposing Counsel
+        """
+        fields = self._opposing_counsel_letter_fields(client, opposing_party, opposing_attorney,
+                                                      opposing_firm, opposing_address, case_type,
+                                                      index_number, as_of)
+        return OPPOSING_COUNSEL_LETTER_TEMPLATE.render(**fields)
+
+    def write_opposing_counsel_letter(self,
+                                      fp: IO[str],
+                                      client: PartyInfo,
+                                      opposing_party: PartyInfo,
+                                      opposing_attorney: str,
+                                      opposing_firm: str,
+                                      opposing_address: str,
+                                      case_type: str,
+                                      index_number: str = "",
+                                      as_of: Optional[date] = None) -> None:
+        """Stream the Opposing Counsel Letter to a text file object"""
+        fields = self._opposing_counsel_letter_fields(client, opposing_party, opposing_attorney,
+                                                      opposing_firm, opposing_address, case_type,
+                                                      index_number, as_of)
+        OPPOSING_COUNSEL_LETTER_TEMPLATE.write(fp, **fields)
+
+    def _notice_of_appearance_fields(self,
+                                     client: PartyInfo,
+                                     opposing_party: PartyInfo,
+                                     county: str,
+                                     index_number: str,
+                                     attorney_name: str,
+                                     as_of: Optional[date] = None) -> Dict:
+        """Fields for the Notice of Appearance template"""
+        today = today_string(as_of)
+
+        return dict(
+            county_upper=county.upper(),
+            client=client, opposing_party=opposing_party,
+            index_number=index_number, today=today,
+            attorney_name=attorney_name,
+            firm_name=self.firm_name, firm_address=self.firm_address,
+            firm_phone=self.firm_phone)
+
+    def generate_notice_of_appearance(self,
+                                      client: PartyInfo,
+                                      opposing_party: PartyInfo,
+                                      county: str,
+                                      index_number: str,
+                                      attorney_name: str,
+                                      as_of: Optional[date] = None) -> str:
+        """
+        Generate Notice of Appearance
+        """
+        fields = self._notice_of_appearance_fields(client, opposing_party, county, index_number,
+                                                   attorney_name, as_of)
+        return NOTICE_OF_APPEARANCE_TEMPLATE.render(**fields)
+
+    def write_notice_of_appearance(self,
+                                   fp: IO[str],
+                                   client: PartyInfo,
+                                   opposing_party: PartyInfo,
+                                   county: str,
+                                   index_number: str,
+                                   attorney_name: str,
+                                   as_of: Optional[date] = None) -> None:
+        """Stream the Notice of Appearance to a text file object"""
+        fields = self._notice_of_appearance_fields(client, opposing_party, county, index_number,
+                                                   attorney_name, as_of)
+        NOTICE_OF_APPEARANCE_TEMPLATE.write(fp, **fields)
+
+    def _summons_with_notice_fields(self,
+                                    plaintiff: PartyInfo,
+                                    defendant: PartyInfo,
+                                    county: str,
+                                    relief_requested: List[str],
+                                    as_of: Optional[date] = None) -> Dict:
+        """Fields for the Summons with Notice template"""
+        today = today_string(as_of)
+
+        relief_text = marked_lines(CHECKBOX, relief_requested)
+
+        return dict(
+            county_upper=county.upper(),
+            plaintiff=plaintiff, defendant=defendant,
+            today=today, relief_text=relief_text,
+            signature_block=self.signature_block,
+            firm_name=self.firm_name, firm_address=self.firm_address,
+            firm_phone=self.firm_phone)
+
+    def generate_summons_with_notice(self,
+                                     plaintiff: PartyInfo,
+                                     defendant: PartyInfo,
+                                     county: str,
+                                     relief_requested: List[str],
+                                     as_of: Optional[date] = None) -> str:
+        """
+        Generate Summons with Notice for Divorce
+        """
+        fields = self._summons_with_notice_fields(plaintiff, defendant, county, relief_requested,
+                                                  as_of)
+        return SUMMONS_WITH_NOTICE_TEMPLATE.render(**fields)
+
+    def write_summons_with_notice(self,
+                                  fp: IO[str],
+                                  plaintiff: PartyInfo,
+                                  defendant: PartyInfo,
+                                  county: str,
+                                  relief_requested: List[str],
+                                  as_of: Optional[date] = None) -> None:
+        """Stream the Summons with Notice to a text file object"""
+        fields = self._summons_with_notice_fields(plaintiff, defendant, county, relief_requested,
+                                                  as_of)
+        SUMMONS_WITH_NOTICE_TEMPLATE.write(fp, **fields)
+
+    def generate_batch(self, document: str, jobs: List[Dict],
+                       workers: Optional[int] = None) -> List[str]:
+        """
+        Generate one document kind (e.g. 'engagement_letter') for each dict of
+        keyword arguments in jobs, in order.
+
+        A document renders in microseconds, so batches run in-process unless
+        workers > 1 is given to spread a very large batch over processes.
+        """
+        if not workers or workers < 2:
+            generate = getattr(self, f"generate_{document}")
+            return [generate(**job) for job in jobs]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(partial(_generate_job, self, document), jobs,
+                                     chunksize=max(1, len(jobs) // (workers * 4))))
+
+    def generate_documents(self, specs: Iterable[DocSpec],
+                           workers: Optional[int] = None) -> List[str]:
+        """
+        Generate a mixed batch of documents, in order. Shared setup (letterhead,
+        footer, date string) is already computed once per instance or per day.
+
+        As with generate_batch, workers > 1 spreads the batch over processes.
+        """
+        if not workers or workers < 2:
+            return [getattr(self, f"generate_{spec.document}")(**spec.params) for spec in specs]
+        specs = list(specs)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(partial(_generate_spec, self), specs,
+                                     chunksize=max(1, len(specs) // (workers * 4))))
+
+    def generate_bytes(self, document: str, *args, **kwargs) -> bytes:
+        """
+        Generate a document by name (e.g. 'engagement_letter') as UTF-8 bytes,
+        ready for a file, attachment or HTTP response
+        """
+        return getattr(self, f"generate_{document}")(*args, **kwargs).encode("utf-8")
+
+
+def _generate_job(templates: DocumentTemplates, document: str, job: Dict) -> str:
+    """Generate one batch job; module-level so process pools can pickle it"""
+    return getattr(templates, f"generate_{document}")(**job)
+
+
+def _generate_spec(templates: DocumentTemplates, spec: DocSpec) -> str:
+    """Generate one DocSpec; module-level so process pools can pickle it"""
+    return _generate_job(templates, spec.document, spec.params)
+
+
+DEFAULT_TEMPLATES = DocumentTemplates()
+
+
+@lru_cache(maxsize=32)
+def _shared_templates(firm_name: str, firm_address: str, firm_phone: str) -> DocumentTemplates:
+    """Return the shared DocumentTemplates instance for a firm"""
+    return DocumentTemplates(firm_name=firm_name, firm_address=firm_address,
+                             firm_phone=firm_phone)
 
 
 def create_document_templates(firm_config=None) -> DocumentTemplates:
-    """Factory function to create document templates"""
+    """Factory function to get (shared) document templates"""
     if firm_config:
-        return DocumentTemplates(
-            firm_name=firm_config.firm_name,
-            firm_address=firm_config.address,
-            firm_phone=firm_config.phone
-        )
-    return DocumentTemplates()
+        return _shared_templates(firm_config.firm_name, firm_config.address,
+                                 firm_config.phone)
+    return DEFAULT_TEMPLATES
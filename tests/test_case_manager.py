@@ -0,0 +1,371 @@
+import gc
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from datetime import date, timedelta
+import weakref
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import mock
+
+import case_manager
+from case_manager import CaseManager, SQLiteCaseStore
+
+
+LEGACY_DATA = {
+    'cases': {
+        'CASE-1': {
+            'id': 'CASE-1', 'case_number': '123/2024', 'client_name': 'Jane Doe',
+            'opposing_party': 'John Doe', 'case_type': 'Contested Divorce',
+            'status': 'Active', 'court': 'Supreme Court', 'county': 'Kings',
+            'open_date': '2024-01-02', 'tasks': ['TASK-1'], 'deadlines': ['DL-1'],
+        },
+    },
+    'deadlines': {
+        'DL-1': {
+            'id': 'DL-1', 'case_id': 'CASE-1', 'title': 'Preliminary conference',
+            'deadline_type': 'Court Date', 'due_date': '2030-05-01',
+        },
+    },
+    # Written before status/priority existed: both must come back as defaults
+    'tasks': {
+        'TASK-1': {
+            'id': 'TASK-1', 'case_id': 'CASE-1', 'title': 'Collect tax returns',
+            'created_date': '2024-01-02T09:00:00',
+        },
+    },
+    'notes': {},
+}
+
+
+class CaseManagerTestCase(unittest.TestCase):
+    """Gives each test a scratch directory for its data files"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = self._tmp.name
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.dir, name)
+
+    def manager(self, name: str = 'case_data.db') -> CaseManager:
+        manager = CaseManager(self.path(name))
+        self.addCleanup(manager.close)
+        return manager
+
+    def write_legacy(self, name: str = 'case_data.json', data: dict = LEGACY_DATA) -> str:
+        path = self.path(name)
+        with open(path, 'w') as f:
+            json.dump(data, f)
+        return path
+
+    def count_writes(self, manager: CaseManager) -> list:
+        """Record the thread of every store write the manager makes"""
+        threads = []
+        write = manager._store.write
+
+        def counting_write(payload):
+            threads.append(threading.current_thread())
+            write(payload)
+
+        manager._store.write = counting_write
+        return threads
+
+
+class LegacyRecordTests(CaseManagerTestCase):
+
+    def test_record_missing_defaulted_fields_survives_save_and_reload(self):
+        self.write_legacy()
+        manager = self.manager()
+        manager.flush()
+
+        reloaded = self.manager()
+        task = reloaded.tasks['TASK-1']
+        self.assertEqual(task.status, 'Pending')
+        self.assertEqual(task.priority, 'Medium')
+        self.assertEqual(task.created_date, '2024-01-02T09:00:00')
+        self.assertEqual(set(reloaded.cases), {'CASE-1'})
+        self.assertEqual(reloaded.deadlines['DL-1'].reminder_days, [7, 3, 1])
+
+    def test_json_store_fills_defaults_when_rewriting(self):
+        path = self.write_legacy()
+        manager = self.manager('case_data.json')
+        manager.add_note({'case_id': 'CASE-1', 'content': 'Called client', 'author': 'AB'})
+        manager.flush()
+
+        with open(path) as f:
+            stored = json.load(f)
+        self.assertEqual(stored['tasks']['TASK-1']['status'], 'Pending')
+        self.assertEqual(len(stored['notes']), 1)
+
+
+class MigrationTests(CaseManagerTestCase):
+
+    def test_json_file_is_migrated_to_sqlite(self):
+        legacy = self.write_legacy()
+        self.manager().flush()
+        self.assertTrue(os.path.exists(self.path('case_data.db')))
+        self.assertFalse(os.path.exists(self.path('case_data.db.migrating')))
+
+        os.remove(legacy)
+        reloaded = self.manager()
+        self.assertEqual(set(reloaded.cases), {'CASE-1'})
+        self.assertEqual(reloaded.cases['CASE-1'].client_name, 'Jane Doe')
+        self.assertEqual(set(reloaded.deadlines), {'DL-1'})
+        self.assertEqual(set(reloaded.tasks), {'TASK-1'})
+
+    def test_legacy_file_is_left_in_place(self):
+        legacy = self.write_legacy()
+        with open(legacy, 'rb') as f:
+            before = f.read()
+        self.manager().flush()
+        with open(legacy, 'rb') as f:
+            self.assertEqual(f.read(), before)
+
+    def test_unreadable_legacy_file_is_set_aside_and_changes_are_saved(self):
+        legacy = self.path('case_data.json')
+        with open(legacy, 'w') as f:
+            f.write('{"cases": {')
+        with redirect_stdout(StringIO()) as out:
+            manager = self.manager()
+        self.assertIn('Error loading case data', out.getvalue())
+        self.assertIn('case_data.json.corrupt', out.getvalue())
+
+        manager.create_case({'client_name': 'Jane Doe'})
+        manager.flush()
+        self.assertEqual(len(self.manager().cases), 1)
+        self.assertFalse(os.path.exists(legacy))
+        with open(legacy + '.corrupt') as f:
+            self.assertEqual(f.read(), '{"cases": {')
+
+    def test_legacy_file_with_bad_record_loads_nothing(self):
+        data = dict(LEGACY_DATA, cases={'CASE-2': {'id': 'CASE-2', 'case_number': '9/2024'}})
+        self.write_legacy(data=data)
+        with redirect_stdout(StringIO()):
+            manager = self.manager()
+        self.assertEqual((len(manager.cases), len(manager.tasks)), (0, 0))
+        self.assertTrue(os.path.exists(self.path('case_data.json.corrupt')))
+
+    def test_unreadable_legacy_file_that_cannot_be_moved_raises(self):
+        with open(self.path('case_data.json'), 'w') as f:
+            f.write('{"cases": {')
+        with redirect_stdout(StringIO()), \
+                mock.patch('case_manager.os.replace', side_effect=PermissionError('read-only')):
+            with self.assertRaises(ValueError):
+                CaseManager(self.path('case_data.db'))
+        self.assertFalse(os.path.exists(self.path('case_data.db')))
+
+    def test_failed_first_write_creates_no_database_and_is_retried(self):
+        self.write_legacy()
+        failing = mock.patch.object(SQLiteCaseStore, 'write', side_effect=sqlite3.OperationalError('disk I/O error'))
+        with failing, redirect_stdout(StringIO()) as out:
+            manager = self.manager()
+            manager.add_note({'case_id': 'CASE-1', 'content': 'Called client', 'author': 'AB'})
+            manager.flush()
+
+        self.assertIn('Error migrating case data', out.getvalue())
+        self.assertEqual(os.listdir(self.dir), ['case_data.json'])
+        # Changes made meanwhile went to the JSON file, and the next start migrates them
+        reloaded = self.manager()
+        reloaded.flush()
+        self.assertTrue(os.path.exists(self.path('case_data.db')))
+        self.assertEqual(len(reloaded.notes), 1)
+        self.assertEqual(reloaded.tasks['TASK-1'].status, 'Pending')
+
+
+class WriterTests(CaseManagerTestCase):
+
+    def test_flush_writes_pending_changes(self):
+        manager = self.manager('case_data.json')
+        case = manager.create_case({'client_name': 'Jane Doe'})
+        manager.flush()
+
+        with open(self.path('case_data.json')) as f:
+            stored = json.load(f)
+        self.assertIn(case.id, stored['cases'])
+        self.assertEqual(len(stored['tasks']), len(case.tasks))
+
+    def test_writes_happen_on_a_background_thread(self):
+        manager = self.manager()
+        writes = self.count_writes(manager)
+        manager.create_case({'client_name': 'Jane Doe'})
+        manager.flush()
+
+        self.assertTrue(writes)
+        self.assertNotIn(threading.current_thread(), writes)
+
+    def test_writer_thread_stops_once_the_queue_drains(self):
+        manager = self.manager()
+        manager.create_case({'client_name': 'Jane Doe'})
+        writer = manager._writer
+        manager.flush()
+
+        self.assertIsNone(manager._writer)
+        if writer is not None:
+            writer.join(timeout=5)
+            self.assertFalse(writer.is_alive())
+        # A later change starts a new writer
+        manager.create_case({'client_name': 'John Roe'})
+        manager.flush()
+        self.assertEqual(len(self.manager().cases), 2)
+
+    def test_writer_error_is_printed_and_raised_from_flush(self):
+        manager = self.manager()
+        manager._store.write = mock.Mock(side_effect=sqlite3.OperationalError('disk I/O error'))
+        with redirect_stdout(StringIO()) as out:
+            manager.create_case({'client_name': 'Jane Doe'})
+            with self.assertRaisesRegex(sqlite3.OperationalError, 'disk I/O error'):
+                manager.flush()
+
+        self.assertIn('Error saving case data: disk I/O error', out.getvalue())
+        # Reported once
+        manager.flush()
+
+    def test_close_unregisters_the_manager(self):
+        manager = self.manager()
+        manager.create_case({'client_name': 'Jane Doe'})
+        self.assertIn(manager, case_manager._OPEN_MANAGERS)
+        manager.close()
+        self.assertNotIn(manager, case_manager._OPEN_MANAGERS)
+        self.assertFalse(os.path.exists(self.path('case_data.db-wal')))
+
+    def test_exit_handler_does_not_keep_managers_alive(self):
+        manager = CaseManager(self.path('case_data.db'))
+        manager.create_case({'client_name': 'Jane Doe'})
+        manager.flush()
+        manager._store.close()
+        ref = weakref.ref(manager)
+        del manager
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+class BatchTests(CaseManagerTestCase):
+
+    def test_batch_writes_once(self):
+        manager = self.manager()
+        case = manager.create_case({'client_name': 'Jane Doe'})
+        manager.flush()
+        writes = self.count_writes(manager)
+
+        with manager.batch():
+            for minutes in (10, 20, 30):
+                manager.create_task({'case_id': case.id, 'title': f'Call ({minutes} min)',
+                                     'estimated_minutes': minutes})
+            manager.add_note({'case_id': case.id, 'content': 'Left voicemail', 'author': 'AB'})
+            self.assertEqual(writes, [])
+        manager.flush()
+
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(len(self.manager().tasks), len(manager.tasks))
+
+    def test_nested_batches_write_once(self):
+        manager = self.manager()
+        writes = self.count_writes(manager)
+        with manager.batch():
+            manager.create_case({'client_name': 'Jane Doe'})
+            with manager.batch():
+                manager.create_case({'client_name': 'John Roe'})
+        manager.flush()
+
+        self.assertEqual(len(writes), 1)
+
+    def test_save_error_in_batch_is_surfaced(self):
+        manager = self.manager()
+        case = manager.create_case({'client_name': 'Jane Doe'})
+        manager.flush()
+        manager._store.write = mock.Mock(side_effect=sqlite3.OperationalError('database is locked'))
+
+        with redirect_stdout(StringIO()) as out:
+            with manager.batch():
+                manager.create_task({'case_id': case.id, 'title': 'File summons'})
+                manager.add_note({'case_id': case.id, 'content': 'Served', 'author': 'AB'})
+            with self.assertRaisesRegex(sqlite3.OperationalError, 'database is locked'):
+                manager.flush()
+
+        self.assertEqual(manager._store.write.call_count, 1)
+        self.assertIn('Error saving case data: database is locked', out.getvalue())
+
+
+class CaseSummaryTests(CaseManagerTestCase):
+
+    def test_summary_changes_do_not_leak_into_the_cache(self):
+        manager = self.manager()
+        case = manager.create_case({'client_name': 'Jane Doe'})
+        summary = manager.get_case_summary(case.id)
+        pending = len(summary['pending_tasks'])
+
+        summary['pending_tasks'].clear()
+        summary['total_tasks'] = 0
+        summary['extra'] = True
+
+        again = manager.get_case_summary(case.id)
+        self.assertEqual(len(again['pending_tasks']), pending)
+        self.assertEqual(again['total_tasks'], len(case.tasks))
+        self.assertNotIn('extra', again)
+
+    def test_unknown_case_gives_empty_summary(self):
+        self.assertEqual(self.manager().get_case_summary('CASE-missing'), {})
+
+
+class DeadlineTests(CaseManagerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cm = self.manager()
+        self.case = self.cm.create_case({'client_name': 'Jane Doe'})
+        self.today = date(2030, 1, 1)
+
+    def add_deadline(self, days: int):
+        return self.cm.create_deadline({'case_id': self.case.id, 'title': f'Due in {days} days',
+                                        'due_date': (self.today + timedelta(days=days)).isoformat()})
+
+    def upcoming(self, days: int = 14):
+        return [dl.id for dl in self.cm.get_upcoming_deadlines(days, today=self.today)]
+
+    def test_rescheduled_deadline_stays_upcoming(self):
+        deadline = self.add_deadline(3)
+        self.assertEqual(self.upcoming(), [deadline.id])
+
+        deadline.due_date = (self.today + timedelta(days=5)).isoformat()
+        self.assertEqual(self.upcoming(), [deadline.id])
+        self.assertEqual(self.upcoming(), [deadline.id])
+        self.assertEqual(self.upcoming(4), [])
+
+    def test_deadline_moved_out_of_range_and_back(self):
+        deadline = self.add_deadline(3)
+        deadline.due_date = (self.today + timedelta(days=30)).isoformat()
+        self.assertEqual(self.upcoming(), [])
+        self.assertEqual(self.upcoming(31), [deadline.id])
+
+    def test_update_deadline_catches_earlier_date(self):
+        deadline = self.add_deadline(30)
+        self.assertEqual(self.upcoming(), [])
+
+        self.cm.update_deadline(deadline.id, {'due_date': (self.today + timedelta(days=2)).isoformat()})
+        self.assertEqual(self.upcoming(), [deadline.id])
+        # The entry for the old date is not reported again
+        self.assertEqual(self.upcoming(60), [deadline.id])
+
+    def test_update_deadline_completion(self):
+        deadline = self.add_deadline(3)
+        self.cm.update_deadline(deadline.id, {'completed': True})
+        self.assertEqual(self.upcoming(), [])
+        self.cm.update_deadline(deadline.id, {'completed': False})
+        self.assertEqual(self.upcoming(), [deadline.id])
+
+    def test_upcoming_is_sorted_by_due_date(self):
+        late, early = self.add_deadline(10), self.add_deadline(1)
+        self.cm.update_deadline(late.id, {'due_date': (self.today + timedelta(days=5)).isoformat()})
+        self.assertEqual(self.upcoming(), [early.id, late.id])
+
+    def test_unknown_deadline_update_returns_none(self):
+        self.assertIsNone(self.cm.update_deadline('DL-missing', {'title': 'x'}))
+
+
+if __name__ == '__main__':
+    unittest.main()
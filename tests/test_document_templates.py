@@ -0,0 +1,159 @@
+import io
+import unittest
+from datetime import date
+
+from document_templates import (
+    STIPULATION_OF_SETTLEMENT_TEMPLATE, STIPULATION_SECTIONS, STREAM_CHUNK_SIZE, TEMPLATE_PARTIALS,
+    ChildInfo, CompiledTemplate, DocSpec, DocumentTemplates, PartyInfo, render_sections,
+)
+
+
+PLAINTIFF = PartyInfo(name="Jane Q Doe", address="1 Main St", city="Albany", state="NY",
+                      zip_code="12207", phone="555-1111", email="jane@example.com",
+                      employer="Acme", occupation="Engineer")
+DEFENDANT = PartyInfo(name="John Doe", address="3 Oak Ave", city="Troy", state="NY",
+                      zip_code="12180", phone="555-2222")
+CHILDREN = [ChildInfo(name="Kid One", dob="2010-02-02", age=14, residence="Mother"),
+            ChildInfo(name="Kid Two", dob="2012-03-03", age=12, residence="Father")]
+
+STIPULATION_ARGS = dict(
+    plaintiff=PLAINTIFF, defendant=DEFENDANT, county="Suffolk", index_number="9/24",
+    marriage_date="2001-01-01", children=CHILDREN, custody_arrangement="Joint legal custody",
+    child_support_monthly=1234.5, maintenance_monthly=800, maintenance_duration="3 years",
+    property_division={})
+
+NOTICE_ARGS = dict(client=PLAINTIFF, opposing_party=DEFENDANT, county="Richmond",
+                   index_number="1/24", attorney_name="Ann Lee", as_of=date(2030, 1, 2))
+
+
+def expand_partials(source: str) -> str:
+    """Reference expansion of {partial} fields, for checking against str.format"""
+    while True:
+        expanded = source
+        for name, partial_source in TEMPLATE_PARTIALS.items():
+            expanded = expanded.replace('{' + name + '}', partial_source)
+        if expanded == source:
+            return source
+        source = expanded
+
+
+class CompiledTemplateTests(unittest.TestCase):
+
+    def test_matches_str_format(self):
+        source = "Dear {client.name},\n{{literal}} {amount:,.2f} {label!r} {amount:>12,.2f}\n"
+        template = CompiledTemplate(source, partials={})
+        fields = dict(client=PLAINTIFF, amount=1234.5, label="x")
+        self.assertEqual(template.render(**fields), source.format(**fields))
+        self.assertEqual(template.fields, ['client', 'amount', 'label'])
+
+    def test_partials_are_expanded(self):
+        template = CompiledTemplate("{header}\nBody {name}\n", partials={'header': "== {title} =="})
+        self.assertEqual(template.render(title="T", name="N"), "== T ==\nBody N\n")
+
+    def test_unsupported_field_is_rejected(self):
+        for source in ("{items[0]}", "{0}", "{}"):
+            with self.assertRaises(ValueError):
+                CompiledTemplate(source, partials={})
+
+    def test_iter_render_and_write_match_render(self):
+        source = "".join(f"Line {i}: {{name}} owes {{amount:,.2f}}\n" for i in range(500))
+        template = CompiledTemplate(source, partials={})
+        expected = template.render(name="Jane", amount=10)
+        chunks = list(template.iter_render(name="Jane", amount=10))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks), expected)
+
+        buf = io.StringIO()
+        template.write(buf, name="Jane", amount=10)
+        self.assertEqual(buf.getvalue(), expected)
+
+    def test_stipulation_matches_str_format(self):
+        fields = DocumentTemplates()._stipulation_of_settlement_fields(**STIPULATION_ARGS)
+        reference = expand_partials(STIPULATION_OF_SETTLEMENT_TEMPLATE.source).format(**fields)
+        self.assertEqual(STIPULATION_OF_SETTLEMENT_TEMPLATE.render(**fields), reference)
+        self.assertGreater(len(reference), 2 * STREAM_CHUNK_SIZE)
+        self.assertEqual("".join(STIPULATION_OF_SETTLEMENT_TEMPLATE.iter_render(**fields)), reference)
+
+
+class DocumentPathTests(unittest.TestCase):
+    """Every way of producing a document gives the same text"""
+
+    def setUp(self):
+        self.templates = DocumentTemplates()
+
+    def check_paths(self, document: str, params: dict):
+        expected = getattr(self.templates, f"generate_{document}")(**params)
+
+        buf = io.StringIO()
+        getattr(self.templates, f"write_{document}")(buf, **params)
+        self.assertEqual(buf.getvalue(), expected)
+        self.assertEqual(self.templates.generate_bytes(document, **params).decode('utf-8'), expected)
+        self.assertEqual(self.templates.generate_batch(document, [params, params]), [expected] * 2)
+        self.assertEqual(self.templates.generate_documents([DocSpec(document, params)]), [expected])
+        return expected
+
+    def test_stipulation_of_settlement(self):
+        text = self.check_paths('stipulation_of_settlement', STIPULATION_ARGS)
+        self.assertIn("Kid One, born 2010-02-02", text)
+        self.assertIn("SUFFOLK", text)
+
+    def test_notice_of_appearance(self):
+        text = self.check_paths('notice_of_appearance', NOTICE_ARGS)
+        self.assertIn("January 02, 2030", text)
+
+    def test_process_pool_matches_in_process(self):
+        jobs = [dict(STIPULATION_ARGS, index_number=f"{n}/24") for n in range(8)]
+        expected = self.templates.generate_batch('stipulation_of_settlement', jobs)
+        self.assertEqual(self.templates.generate_batch('stipulation_of_settlement', jobs, workers=2),
+                         expected)
+
+        specs = [DocSpec('stipulation_of_settlement', STIPULATION_ARGS),
+                 DocSpec('notice_of_appearance', NOTICE_ARGS)]
+        self.assertEqual(self.templates.generate_documents(specs, workers=2),
+                         self.templates.generate_documents(specs))
+
+    def test_as_of_fixes_the_date(self):
+        first = self.templates.generate_notice_of_appearance(**NOTICE_ARGS)
+        later = self.templates.generate_notice_of_appearance(**dict(NOTICE_ARGS, as_of=date(2031, 6, 30)))
+        self.assertIn("June 30, 2031", later)
+        self.assertEqual(first.replace("January 02, 2030", "June 30, 2031"), later)
+
+
+class SectionTests(unittest.TestCase):
+
+    def setUp(self):
+        self.templates = DocumentTemplates()
+        self.full = self.templates.generate_stipulation_of_settlement(**STIPULATION_ARGS)
+
+    def test_subset_is_part_of_the_full_document(self):
+        names = ['maintenance', 'child_support']
+        text = self.templates.generate_stipulation_of_settlement(**STIPULATION_ARGS, sections=names)
+        fields = self.templates._stipulation_of_settlement_fields(**STIPULATION_ARGS)
+        expected = "".join(STIPULATION_SECTIONS[name].render(
+            **{field: fields[field] for field in STIPULATION_SECTIONS[name].fields})
+            for name in ('child_support', 'maintenance'))
+        self.assertEqual(text, expected)
+        self.assertIn(text, self.full)
+        self.assertIn("$1,234.50", text)
+
+        buf = io.StringIO()
+        self.templates.write_stipulation_of_settlement(buf, **STIPULATION_ARGS, sections=names)
+        self.assertEqual(buf.getvalue(), text)
+
+    def test_all_sections_give_the_full_document(self):
+        text = self.templates.generate_stipulation_of_settlement(
+            **STIPULATION_ARGS, sections=list(STIPULATION_SECTIONS))
+        self.assertEqual(text, self.full)
+
+    def test_children_section_can_be_left_out(self):
+        text = self.templates.generate_stipulation_of_settlement(
+            **STIPULATION_ARGS, sections=[name for name in STIPULATION_SECTIONS if name != 'children'])
+        self.assertNotIn("Kid One", text)
+
+    def test_unknown_section_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, 'alimony'):
+            render_sections(STIPULATION_SECTIONS, ['caption', 'alimony'], {})
+
+
+if __name__ == '__main__':
+    unittest.main()